@@ -0,0 +1,133 @@
+# Asset Cache:
+# Decode and resize the NBA logo and the 30 team logos once, keep the PhotoImages for reuse,
+# and pack the resized logos into a single atlas PNG that Tk can slice without decoding each file.
+
+import json
+import os
+import struct
+import threading
+import tkinter as tk
+
+LOGO_SIZE = (100, 100)
+NBA_LOGO_SIZE = (100, 200)
+
+
+def png_size(path):
+    # Width and height from a PNG's IHDR chunk, without decoding the image
+    try:
+        with open(path, "rb") as png_file:
+            header = png_file.read(24)
+    except OSError:
+        return None
+    if header[:8] != b"\x89PNG\r\n\x1a\n":
+        return None
+    return struct.unpack(">II", header[16:24])
+
+
+class AssetCache:
+    def __init__(self, logo_directory="NBA_Logos", nba_logo_path="NBA_logo.png", atlas_directory="asset_cache"):
+        # name -> (source path, size it is shown at)
+        self.sources = {"NBA_logo": (nba_logo_path, NBA_LOGO_SIZE)}
+        for file_name in sorted(os.listdir(logo_directory)):
+            if file_name.endswith(".png"):
+                self.sources[file_name[:-4]] = (os.path.join(logo_directory, file_name), LOGO_SIZE)
+
+        # Set atlas_directory to None to keep everything in memory
+        self.atlas_path = os.path.join(atlas_directory, "logos.png") if atlas_directory else None
+        self.index_path = os.path.join(atlas_directory, "logos.json") if atlas_directory else None
+        self.resized = {}
+        self.photos = {}
+        self.atlas = None
+        self.index = None
+        self.animations = {}
+        self.lock = threading.Lock()
+
+    def preload(self):
+        # Decode and resize every logo in a worker thread, PhotoImages are still created on the Tk thread
+        threading.Thread(target=self.build, daemon=True).start()
+
+    def build(self):
+        if self.load_index() is not None:
+            return
+        for name in self.sources:
+            self.resized_image(name)
+        if self.atlas_path:
+            self.write_atlas()
+
+    def resized_image(self, name):
+        # Pillow is only imported when a logo actually has to be resized or packed
+        from PIL import Image
+
+        with self.lock:
+            if name not in self.resized:
+                path, size = self.sources[name]
+                self.resized[name] = Image.open(path).convert("RGBA").resize(size)
+            return self.resized[name]
+
+    def source_stamps(self):
+        return {name: [path, list(size), os.path.getmtime(path)] for name, (path, size) in self.sources.items()}
+
+    def load_index(self):
+        # The atlas is only used while every source logo is unchanged since it was packed
+        if self.index is None and self.index_path and os.path.exists(self.atlas_path):
+            try:
+                with open(self.index_path, encoding="utf-8") as index_file:
+                    index = json.load(index_file)
+            except (OSError, ValueError):
+                return None
+            if index.get("sources") == self.source_stamps():
+                self.index = index["boxes"]
+        return self.index
+
+    def write_atlas(self):
+        # Pack the resized logos side by side into one PNG and record where each one sits
+        from PIL import Image
+
+        width = sum(self.sources[name][1][0] for name in self.sources)
+        height = max(size[1] for _, size in self.sources.values())
+        atlas = Image.new("RGBA", (width, height))
+        boxes = {}
+        x = 0
+        for name in self.sources:
+            image = self.resized_image(name)
+            atlas.paste(image, (x, 0))
+            boxes[name] = [x, 0, x + image.width, image.height]
+            x += image.width
+
+        os.makedirs(os.path.dirname(self.atlas_path), exist_ok=True)
+        atlas.save(self.atlas_path)
+        with open(self.index_path, "w", encoding="utf-8") as index_file:
+            json.dump({"sources": self.source_stamps(), "boxes": boxes}, index_file)
+
+    def photo(self, name):
+        # Must be called from the Tk thread; every logo becomes a PhotoImage only once
+        if name in self.photos:
+            return self.photos[name]
+
+        index = self.load_index()
+        if index is not None and name in index:
+            # Slice the logo straight out of the atlas with Tk, no PNG decode per logo
+            if self.atlas is None:
+                self.atlas = tk.PhotoImage(file=self.atlas_path)
+            photo = tk.PhotoImage(width=index[name][2] - index[name][0], height=index[name][3] - index[name][1])
+            photo.tk.call(photo, "copy", self.atlas, "-from", *index[name])
+        elif png_size(self.sources[name][0]) == self.sources[name][1]:
+            # Logos already saved at their display size load natively in Tk
+            photo = tk.PhotoImage(file=self.sources[name][0])
+        else:
+            from PIL import ImageTk
+            photo = ImageTk.PhotoImage(self.resized_image(name))
+        self.photos[name] = photo
+        return photo
+
+    def animation(self, path):
+        # Every frame of an animated gif, decoded by Tk once per session
+        if path not in self.animations:
+            frames = []
+            while True:
+                try:
+                    frames.append(tk.PhotoImage(file=path, format=f"gif -index {len(frames)}"))
+                except tk.TclError:
+                    break
+            self.animations[path] = frames
+        return self.animations[path]
@@ -0,0 +1,73 @@
+# Circuit Breaker:
+# Stop sending requests to a host after repeated failures, so pages fail fast and the app falls
+# back to cached data, then let a single trial request through once the host has had time to recover.
+
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold=3, reset_after=60):
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at = None
+        self.trial = False
+        self.lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.reset_after else "open"
+
+    def allow(self):
+        # Closed lets everything through, half-open lets one trial request through at a time
+        with self.lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self.trial:
+                self.trial = True
+                return True
+            return False
+
+    def success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial = False
+
+    def failure(self):
+        with self.lock:
+            self.failures += 1
+            self.trial = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class HostBreakers:
+    # One breaker per host name, created on first use
+    def __init__(self, failure_threshold=3, reset_after=60):
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.breakers = {}
+        self.lock = threading.Lock()
+
+    def get(self, url):
+        host = urlparse(url).netloc
+        with self.lock:
+            if host not in self.breakers:
+                self.breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_after)
+            return self.breakers[host]
+
+    def check(self, url):
+        breaker = self.get(url)
+        if not breaker.allow():
+            raise CircuitOpenError(f"{urlparse(url).netloc} is failing, using cached data until it recovers")
+        return breaker
@@ -0,0 +1,65 @@
+# Comparison Grid:
+# A Canvas that shows two players' stats side by side and colors each cell on its own, using
+# three shared tags (better/worse/equal) so a new selection only re-texts and re-tags the cells.
+
+import tkinter as tk
+
+OUTCOME_COLORS = {"better": "green", "worse": "red", "equal": "white"}
+
+
+class ComparisonGrid(tk.Canvas):
+    def __init__(self, master, row_height=24, font=("Helvetica", 12), **options):
+        options.setdefault("bg", "black")
+        options.setdefault("highlightthickness", 0)
+        options.setdefault("yscrollincrement", row_height)
+        super().__init__(master, **options)
+        self.row_height = row_height
+        self.font = font
+        self.cells = []
+        self.shown = []
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind(sequence, self.on_wheel)
+        self.bind("<Configure>", lambda _: self.layout())
+
+    def resize(self, count):
+        # Keep exactly one (left, middle, right) set of text items per row
+        while len(self.cells) < count:
+            self.cells.append((self.create_text(0, 0, anchor='e', font=self.font, tags=("equal",)),
+                               self.create_text(0, 0, anchor='center', font=self.font, fill='lightgray'),
+                               self.create_text(0, 0, anchor='w', font=self.font, tags=("equal",))))
+            self.shown.append(None)
+        while len(self.cells) > count:
+            self.delete(*self.cells.pop())
+            self.shown.pop()
+        self.layout()
+
+    def layout(self):
+        width = self.winfo_width()
+        for row_num, (left, middle, right) in enumerate(self.cells):
+            y = (row_num + 0.5) * self.row_height
+            self.coords(left, width * 0.4 - 10, y)
+            self.coords(middle, width * 0.5, y)
+            self.coords(right, width * 0.6 + 10, y)
+        self.config(scrollregion=(0, 0, width, len(self.cells) * self.row_height))
+
+    def set_rows(self, rows):
+        # rows are (left text, label, right text, left outcome, right outcome); only changed cells are touched
+        if len(rows) != len(self.cells):
+            self.resize(len(rows))
+        for row_num, (cells, row) in enumerate(zip(self.cells, rows)):
+            if self.shown[row_num] == row:
+                continue
+            left, middle, right = cells
+            self.itemconfigure(left, text=row[0], tags=(row[3],))
+            self.itemconfigure(middle, text=row[1])
+            self.itemconfigure(right, text=row[2], tags=(row[4],))
+            self.shown[row_num] = row
+
+        # One fill per shared tag colors every cell
+        for tag, color in OUTCOME_COLORS.items():
+            self.itemconfigure(tag, fill=color)
+
+    def on_wheel(self, event):
+        self.yview_scroll(-1 if event.num == 4 or event.delta > 0 else 1, "units")
+        return "break"
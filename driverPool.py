@@ -0,0 +1,140 @@
+# Driver Pool:
+# Keep a bounded set of warm, headless Chrome sessions that are reused across team selections,
+# health checked before use, recycled after a number of pages and shut down when the app exits.
+
+import atexit
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+
+class PooledDriver:
+    # Wraps a WebDriver and counts the pages it has rendered
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+
+    def get(self, url):
+        self.pages += 1
+        self.driver.get(url)
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+
+class DriverPool:
+    def __init__(self, size=2, max_pages=50, headless=True, page_load_timeout=30, metrics=None):
+        self.size = size
+        self.metrics = metrics
+        self.max_pages = max_pages
+        self.headless = headless
+        self.page_load_timeout = page_load_timeout
+        self.idle = queue.LifoQueue()
+        self.created = 0
+        self.closed = False
+        self.lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    def create_driver(self):
+        # Imported here so selenium only loads when the first browser session starts
+        from selenium import webdriver
+
+        chrome_options = webdriver.ChromeOptions()
+        if self.headless:
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920,1080")
+        start = time.perf_counter()
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.set_page_load_timeout(self.page_load_timeout)
+        if self.metrics:
+            self.metrics.record("driver.start", time.perf_counter() - start)
+
+            # Every WebDriver command, including element lookups and .text, goes through execute
+            driver.execute = self.metrics.counting("webdriver", driver.execute)
+        return PooledDriver(driver)
+
+    def warm(self, count=1):
+        # Start sessions in the background so the first click does not pay Chrome's cold start
+        def start():
+            for _ in range(count):
+                if not self.reserve():
+                    return
+                try:
+                    self.idle.put(self.create_driver())
+                except Exception as error:
+                    self.unreserve()
+                    print(f"Could not warm a browser session: {error}")
+                    return
+        threading.Thread(target=start, daemon=True).start()
+
+    def reserve(self):
+        with self.lock:
+            if self.closed or self.created >= self.size:
+                return False
+            self.created += 1
+            return True
+
+    def unreserve(self):
+        with self.lock:
+            self.created -= 1
+
+    def healthy(self, pooled):
+        if pooled.pages >= self.max_pages:
+            return False
+        try:
+            pooled.driver.title
+            return True
+        except Exception:
+            return False
+
+    def discard(self, pooled):
+        self.unreserve()
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+    def acquire(self, timeout=None):
+        while True:
+            if self.closed:
+                raise RuntimeError("Driver pool has been shut down")
+            try:
+                pooled = self.idle.get_nowait()
+            except queue.Empty:
+                # Grow up to the size limit, otherwise wait for a session to be released
+                if self.reserve():
+                    try:
+                        return self.create_driver()
+                    except Exception:
+                        self.unreserve()
+                        raise
+                pooled = self.idle.get(timeout=timeout)
+
+            if self.healthy(pooled):
+                return pooled
+            self.discard(pooled)
+
+    def release(self, pooled):
+        if self.closed or pooled.pages >= self.max_pages:
+            self.discard(pooled)
+        else:
+            self.idle.put(pooled)
+
+    @contextmanager
+    def session(self, timeout=None):
+        pooled = self.acquire(timeout)
+        try:
+            yield pooled
+        finally:
+            self.release(pooled)
+
+    def shutdown(self):
+        self.closed = True
+        while True:
+            try:
+                pooled = self.idle.get_nowait()
+            except queue.Empty:
+                break
+            self.discard(pooled)
@@ -0,0 +1,165 @@
+# Game Log:
+# Stream a team's per-game box scores into a local store, newest games first, stopping at the first
+# game already stored, and keep last-5/last-10 rolling averages up to date one game at a time.
+
+import json
+import sqlite3
+import threading
+from collections import deque
+from datetime import datetime
+from itertools import takewhile
+
+from statTable import parse_number
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS game_logs (
+    team_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    game_date TEXT NOT NULL,
+    matchup TEXT NOT NULL,
+    header TEXT NOT NULL,
+    row TEXT NOT NULL,
+    PRIMARY KEY (team_id, season, game_date, matchup)
+);
+"""
+
+# Rolling windows, in games, and the box score columns averaged over them
+WINDOWS = (5, 10)
+ROLLING_STATS = ("PTS", "REB", "AST", "+/-")
+
+# Box score columns shown per game in the game-to-game tab
+GAME_COLUMNS = ("Game Date", "Match Up", "W/L", "MIN", "PTS", "FG%", "3P%", "REB", "AST", "TOV", "+/-")
+
+
+def game_date(text):
+    # nba.com box scores use MM/DD/YYYY; store ISO dates so they sort chronologically
+    try:
+        return datetime.strptime(text.strip(), "%m/%d/%Y").date().isoformat()
+    except ValueError:
+        return text.strip()
+
+
+def header_key(column):
+    # "Game Date", "GAME DATE" and "Game_Date" all name the same column
+    return "".join(character for character in column.lower() if character.isalnum())
+
+
+def iter_games(table):
+    # Yield (game_date, matchup, row) from a scraped [header] + rows box score table, newest first;
+    # a table without date and matchup columns yields nothing
+    header = [header_key(column) for column in table[0]]
+    date_i = next((header.index(key) for key in ("gamedate", "date") if key in header), None)
+    matchup_i = header.index("matchup") if "matchup" in header else None
+    if date_i is None or matchup_i is None:
+        return
+    for row in table[1:]:
+        if len(row) > max(date_i, matchup_i) and row[date_i].strip():
+            yield game_date(row[date_i]), row[matchup_i].strip(), row
+
+
+def iter_stat_values(header, row, stats=ROLLING_STATS):
+    for stat in stats:
+        i = header.index(stat) if stat in header else None
+        try:
+            yield stat, parse_number(row[i]) if i is not None and i < len(row) else 0.0
+        except ValueError:
+            yield stat, 0.0
+
+
+class RollingAverage:
+    # Average of the last `window` values, updated in O(1) per value
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self.total = 0.0
+
+    def push(self, value):
+        self.values.append(value)
+        self.total += value
+        if len(self.values) > self.window:
+            self.total -= self.values.popleft()
+        return self.value
+
+    @property
+    def value(self):
+        return self.total / len(self.values) if self.values else 0.0
+
+
+class GameLog:
+    # One team's season of games in chronological order, with the rolling averages as of each game
+    def __init__(self, header=None):
+        self.header = header or []
+        self.games = []
+        self.keys = set()
+        self.averages = {stat: {window: RollingAverage(window) for window in WINDOWS} for stat in ROLLING_STATS}
+        self.rolling = []
+
+    def add(self, key, row):
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        self.games.append(row)
+        self.rolling.append({stat: {window: self.averages[stat][window].push(value) for window in WINDOWS}
+                             for stat, value in iter_stat_values(self.header, row)})
+        return True
+
+    def last(self):
+        # Current rolling averages: {stat: {window: average}}
+        return {stat: {window: average.value for window, average in windows.items()} for stat, windows in self.averages.items()}
+
+    def columns(self):
+        return [column for column in GAME_COLUMNS if column in self.header] + [f"L{window} PTS" for window in WINDOWS]
+
+    def rows(self):
+        # Newest game first, each with the scoring averages as they stood after that game
+        indexes = [self.header.index(column) for column in GAME_COLUMNS if column in self.header]
+        rows = []
+        for row, rolling in zip(reversed(self.games), reversed(self.rolling)):
+            rows.append([row[i] if i < len(row) else "" for i in indexes] + [f"{rolling['PTS'][window]:.1f}" for window in WINDOWS])
+        return rows
+
+
+class GameLogStore:
+    def __init__(self, path="hoop_history.db"):
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.logs = {}
+        with self.lock, self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def log(self, team_id, season):
+        # Rebuild a team's rolling state from the store once per session, then keep it in memory
+        with self.lock:
+            return self._log(team_id, season)
+
+    def _log(self, team_id, season):
+        if (team_id, season) not in self.logs:
+            game_log = GameLog()
+            stored = self.connection.execute(
+                "SELECT game_date, matchup, header, row FROM game_logs WHERE team_id = ? AND season = ? ORDER BY game_date, matchup",
+                (team_id, season))
+            for date, matchup, header, row in stored:
+                game_log.header = game_log.header or json.loads(header)
+                game_log.add((date, matchup), json.loads(row))
+            self.logs[team_id, season] = game_log
+        return self.logs[team_id, season]
+
+    def ingest(self, team_id, season, table):
+        # Stream the scraped table newest first and stop at the first game already stored,
+        # so a refresh only parses, stores and averages the games played since the last one
+        if not table or not table[0]:
+            return self.log(team_id, season)
+        with self.lock:
+            game_log = self._log(team_id, season)
+            new_games = list(takewhile(lambda game: (game[0], game[1]) not in game_log.keys, iter_games(table)))
+            if not new_games:
+                return game_log
+            header = json.dumps(table[0])
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT OR IGNORE INTO game_logs (team_id, season, game_date, matchup, header, row) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(team_id, season, date, matchup, header, json.dumps(row)) for date, matchup, row in new_games])
+            game_log.header = game_log.header or list(table[0])
+            for date, matchup, row in sorted(new_games, key=lambda game: (game[0], game[1])):
+                game_log.add((date, matchup), row)
+            return game_log
@@ -0,0 +1,97 @@
+# History Store:
+# Append every scraped player stats and team stats table into a local SQLite database, keyed by
+# team id, season and scrape time, with indexes for fast per-player and per-team range queries.
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import date
+
+from statTable import normalize_name
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS stat_tables (
+    id INTEGER PRIMARY KEY,
+    team_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    scraped_at REAL NOT NULL,
+    header TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stat_rows (
+    table_id INTEGER NOT NULL REFERENCES stat_tables(id),
+    team_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    scraped_at REAL NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    row TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS stat_tables_team ON stat_tables (team_id, kind, season, scraped_at);
+CREATE INDEX IF NOT EXISTS stat_rows_player ON stat_rows (name_key, kind, season);
+CREATE INDEX IF NOT EXISTS stat_rows_team ON stat_rows (team_id, kind, season, scraped_at);
+CREATE INDEX IF NOT EXISTS stat_rows_table ON stat_rows (table_id, position);
+"""
+
+
+def current_season(today=None):
+    # NBA seasons start in October, e.g. "2024-25"
+    today = today or date.today()
+    start = today.year if today.month >= 10 else today.year - 1
+    return f"{start}-{str(start + 1)[2:]}"
+
+
+class HistoryStore:
+    def __init__(self, path="hoop_history.db"):
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def append(self, team_id, season, kind, table, scraped_at=None):
+        # table is the scraped [header] + rows list
+        scraped_at = scraped_at or time.time()
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO stat_tables (team_id, season, kind, scraped_at, header) VALUES (?, ?, ?, ?, ?)",
+                (team_id, season, kind, scraped_at, json.dumps(table[0])))
+            self.connection.executemany(
+                "INSERT INTO stat_rows (table_id, team_id, season, kind, scraped_at, position, name, name_key, row) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(cursor.lastrowid, team_id, season, kind, scraped_at, position, row[0] if row else "", normalize_name(row[0]) if row else "", json.dumps(row))
+                 for position, row in enumerate(table[1:])])
+
+    def seasons(self, team_id, kind="player_stats"):
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT DISTINCT season FROM stat_tables WHERE team_id = ? AND kind = ? ORDER BY season DESC", (team_id, kind)).fetchall()
+        return [season for (season,) in rows]
+
+    def latest(self, team_id, season, kind):
+        # The most recent [header] + rows snapshot of a team's table for a season, or None
+        with self.lock:
+            table = self.connection.execute(
+                "SELECT id, header FROM stat_tables WHERE team_id = ? AND kind = ? AND season = ? ORDER BY scraped_at DESC LIMIT 1",
+                (team_id, kind, season)).fetchone()
+            if table is None:
+                return None
+            rows = self.connection.execute("SELECT row FROM stat_rows WHERE table_id = ? ORDER BY position", (table[0],)).fetchall()
+        return [json.loads(table[1])] + [json.loads(row) for (row,) in rows]
+
+    def player_history(self, player, first_season=None, last_season=None, kind="player_stats"):
+        # Every recorded row for a player between two seasons: (season, team_id, scraped_at, header, row)
+        query = ("SELECT r.season, r.team_id, r.scraped_at, t.header, r.row FROM stat_rows r JOIN stat_tables t ON t.id = r.table_id "
+                 "WHERE r.name_key = ? AND r.kind = ? AND r.season BETWEEN ? AND ? ORDER BY r.season, r.scraped_at")
+        with self.lock:
+            rows = self.connection.execute(query, (normalize_name(player), kind, first_season or "", last_season or "9999")).fetchall()
+        return [(season, team_id, scraped_at, json.loads(header), json.loads(row)) for season, team_id, scraped_at, header, row in rows]
+
+    def team_history(self, team_id, first_season=None, last_season=None, kind="overall_stats"):
+        # The latest snapshot of a team's table for each season in the range: {season: [header] + rows}
+        with self.lock:
+            seasons = self.connection.execute(
+                "SELECT DISTINCT season FROM stat_tables WHERE team_id = ? AND kind = ? AND season BETWEEN ? AND ? ORDER BY season",
+                (team_id, kind, first_season or "", last_season or "9999")).fetchall()
+        return {season: self.latest(team_id, season, kind) for (season,) in seasons}
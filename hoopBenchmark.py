@@ -0,0 +1,307 @@
+# Benchmarks:
+# Replay saved team and stats pages through a fake driver, without Chrome or nba.com, and time
+# every get* extractor, StatTable.row lookups and the Treeview population of the About, Franchise,
+# Player Stats and Game-to-Game tabs. Reports throughput and percentiles and fails when a
+# benchmark's median regresses past the stored baseline.
+#
+# The fixtures and the baseline depend on the machine and the season, so both are kept out of git:
+# record them once on the machine that runs the benchmarks (synthetic pages are written when no
+# fixtures exist), save a baseline from the current main, then compare each change against it.
+#
+#   python hoopBenchmark.py --record celtics           # save live pages as fixtures
+#   python hoopBenchmark.py --save-baseline            # time the fixtures and store the baseline
+#   python hoopBenchmark.py                            # time again and compare with the baseline
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from pageSnapshot import PageSnapshot
+from statTable import StatTable
+from metrics import percentile
+
+TEAM = "celtics"
+
+# Fixture file for each page the scrapers read, keyed by the end of the page URL
+FIXTURE_PAGES = {
+    "team": f"/{TEAM}",
+    "players_traditional": "/players-traditional",
+    "traditional": "/traditional",
+    "boxscores": "/boxscores-traditional",
+}
+
+# Extractors and the fixture page each one reads
+EXTRACTORS = {
+    "getRoster": "team", "getCoachingStaff": "team", "getTeamUpdates": "team", "getRetiredNumbers": "team",
+    "getHallOfFame": "team", "getAllTime": "team", "getAchievements": "team",
+    "getPlayerStats": "players_traditional", "getOverallStats": "traditional", "getGameLog": "boxscores",
+}
+
+
+class FixtureDriver:
+    # Stands in for a WebDriver: get() switches to the saved page for the URL, lookups go to its snapshot
+    def __init__(self, pages):
+        self.pages = pages
+        self.page = None
+        self.snapshot = None
+        self.current_url = None
+
+    def get(self, url):
+        self.page = next(page for page, suffix in FIXTURE_PAGES.items() if url.split("?")[0].endswith(suffix))
+        self.snapshot = None
+        self.current_url = url
+
+    @property
+    def page_source(self):
+        return self.pages[self.page]
+
+    def find_element(self, by, value):
+        return self.live().find_element(by, value)
+
+    def find_elements(self, by, value):
+        return self.live().find_elements(by, value)
+
+    def live(self):
+        # Only parsed when an extractor queries the "browser" directly, as in "live" mode
+        if self.snapshot is None:
+            self.snapshot = PageSnapshot(self.page_source, self.current_url)
+        return self.snapshot
+
+
+def html_table(header, rows, attrs=""):
+    head = "".join(f"<th>{column}</th>" for column in header)
+    body = "".join("<tr>" + "".join(f"<td>{value}</td>" for value in row) + "</tr>" for row in rows)
+    return f"<table{attrs}><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def synthesize_fixtures(directory, players=18, games=82, seed=7):
+    # Deterministic stand-in pages with the same structure and class names as the nba.com pages
+    rng = random.Random(seed)
+    names = [f"Player {chr(65 + i % 26)}{i} Name" for i in range(players)]
+    stats = ["GP", "MIN", "PTS", "FGM", "FGA", "FG%", "3PM", "3PA", "3P%", "FTM", "FTA", "FT%", "OREB", "DREB", "REB", "AST", "TOV", "STL", "BLK", "PF", "+/-"]
+
+    def stat_row():
+        return [rng.randint(1, 82)] + [f"{rng.uniform(0, 40):.1f}" for _ in stats[1:]]
+
+    roster = html_table(["PLAYER", "#", "POS", "HEIGHT", "WEIGHT", "BIRTHDATE", "AGE", "EXP", "SCHOOL", "HOW ACQUIRED"],
+                        [[name, i, "F", "6-8", 220, "JAN 01, 1998", 26, 5, "School", "Draft"] for i, name in enumerate(names)])
+    coaches = "".join(f"<h3>{title}</h3><ul>" + "".join(f"<li>Coach {title} {j}</li>" for j in range(count)) + "</ul>"
+                      for title, count in (("Head Coach", 1), ("Assistant Coaches", 6), ("Trainers", 3)))
+    updates = "".join(f'<div class="TeamFantasyNews_articleDate__SrBm7">Apr {i + 1}, 2024</div>'
+                      f'<div class="TeamFantasyNews_articleHeadline__02sbs">Headline {i}</div>'
+                      f'<div class="TeamFantasyNews_articleContent__x7vps">Update content {i} ' + "word " * 40 + "</div>" for i in range(5))
+    retired = html_table(["NO.", "PLAYER", "POSITION", "SEASONS WITH TEAM", "YEAR"], [[i, f"Retired {i}", "G", "1960-1970", 1970 + i] for i in range(24)])
+    hall_of_fame = html_table(["PLAYER", "POSITION", "SEASONS WITH TEAM", "YEAR"], [[f"Famer {i}", "C", "1950-1960", 1980 + i] for i in range(36)])
+    records = html_table([], [[f"Record {i}", f"Holder {i}", rng.randint(100, 30000)] for i in range(12)], ' class="TeamRecords_table__0iapO"')
+    awards = "".join(f'<div class="TeamAwards_group__XU0o9"><h3>{title}</h3><ul>' + "".join(f"<li>{1950 + j * 3}</li>" for j in range(count)) + "</ul></div>"
+                     for title, count in (("Championships", 17), ("Conference Titles", 22), ("Division Titles", 33)))
+    team_page = (f"<html><body><main>{roster}<section class=\"TeamProfile_sectionCoaches__e66bL\">{coaches}</section>{updates}"
+                 f"<div class=\"TeamRetired_content__nb7Qt\">{retired}</div><div class=\"TeamHallOfFame_content__IZSl2\">{hall_of_fame}</div>"
+                 f"{records}{awards}</main></body></html>")
+
+    crom = ' class="Crom_table__p1iZz"'
+    players_page = f"<html><body>{html_table(['Player'] + stats, [[name] + stat_row() for name in names], crom)}</body></html>"
+    traditional_page = "<html><body>" + "".join(html_table(["Split"] + stats, [[f"Split {i}-{j}"] + stat_row() for j in range(3)], crom) for i in range(3)) + "</body></html>"
+    boxscores = [[f"BOS vs. T{i % 29}", rng.choice("WL"), f"{(i // 28) % 12 + 1:02d}/{i % 28 + 1:02d}/2024"] + stat_row()[1:] for i in range(games)]
+    boxscores_page = f"<html><body>{html_table(['Match Up', 'W/L', 'Game Date'] + stats[1:], boxscores, crom)}</body></html>"
+
+    os.makedirs(directory, exist_ok=True)
+    for page, html in (("team", team_page), ("players_traditional", players_page), ("traditional", traditional_page), ("boxscores", boxscores_page)):
+        with open(os.path.join(directory, f"{page}.html"), "w", encoding="utf-8") as fixture_file:
+            fixture_file.write(html)
+
+
+def record_fixtures(directory, team):
+    # Save the rendered pages of one team as fixtures
+    from nbaScraper import NBAScraper, WAIT_SELECTORS
+
+    scraper = NBAScraper()
+    team_pages = scraper.teamPages(team)
+    pages = {"team": ("roster", "franchise"), "players_traditional": ("player_stats",), "traditional": ("overall_stats",), "boxscores": ("game_log",)}
+    os.makedirs(directory, exist_ok=True)
+    try:
+        with scraper.driver_pool.session() as driver:
+            for page, kinds in pages.items():
+                scraper.fetchPage(driver, team_pages[kinds[0]][0], {WAIT_SELECTORS[kind] for kind in kinds})
+                with open(os.path.join(directory, f"{page}.html"), "w", encoding="utf-8") as fixture_file:
+                    fixture_file.write(driver.page_source)
+    finally:
+        scraper.driver_pool.shutdown()
+
+
+def load_fixtures(directory):
+    pages = {}
+    for page in FIXTURE_PAGES:
+        with open(os.path.join(directory, f"{page}.html"), encoding="utf-8") as fixture_file:
+            pages[page] = fixture_file.read()
+    return pages
+
+
+def run(name, function, iterations, operations=1):
+    # Time one benchmark; returns the summary row for it
+    function()
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {"name": name, "iterations": iterations, "p50": percentile(timings, 0.5), "p95": percentile(timings, 0.95),
+            "p99": percentile(timings, 0.99), "max": timings[-1], "throughput": operations * iterations / sum(timings) if sum(timings) else 0.0}
+
+
+def scraper_benchmarks(scraper, pages, iterations):
+    results = []
+    team_pages = scraper.teamPages(TEAM)
+    urls = {"team": team_pages["roster"][0], "players_traditional": team_pages["player_stats"][0],
+            "traditional": team_pages["overall_stats"][0], "boxscores": team_pages["game_log"][0]}
+
+    # Parsing each page once into a snapshot
+    for page, html in pages.items():
+        results.append(run(f"parse.{page}", lambda html=html: PageSnapshot(html), iterations))
+
+    # Each extractor against its already parsed page, as in "source" mode
+    driver = FixtureDriver(pages)
+    for extractor_name, page in EXTRACTORS.items():
+        extractor = getattr(scraper, extractor_name)
+        snapshot = PageSnapshot(pages[page], urls[page])
+
+        def extract(extractor=extractor, page=page, snapshot=snapshot):
+            scraper.loaded_pages[driver] = urls[page]
+            scraper.page_snapshots[driver] = {urls[page]: snapshot}
+            return extractor(driver, urls[page])
+        results.append(run(f"extract.{extractor_name}", extract, iterations))
+
+    # A whole team through the fake driver: load, parse and extract every page
+    def scrape_all():
+        scraper.page_snapshots[driver] = {}
+        scraper.loaded_pages.pop(driver, None)
+        return {kind: extractor(driver, page_str) for kind, (page_str, extractor) in team_pages.items()}
+    results.append(run("scrape.team", scrape_all, max(1, iterations // 5)))
+    return results, scrape_all()
+
+
+def lookup_benchmarks(team_data, iterations):
+    player_stats = StatTable(team_data["player_stats"])
+    players = [row[0] for row in team_data["roster"]["roster"][1:]] + [row[0] for row in player_stats.rows]
+    results = [run("StatTable.build", lambda: StatTable(team_data["player_stats"]), iterations)]
+    results.append(run("StatTable.row", lambda: [player_stats.row(player) for player in players], iterations, len(players)))
+    return results
+
+
+def gui_benchmarks(team_data, iterations):
+    # The tab builders on a real (possibly virtual) display, withdrawn so nothing is shown
+    import tkinter as tk
+    from hoopMetrics import NBAStats
+    from nbaScraper import NBAScraper
+    from historyStore import current_season
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as error:
+        print(f"Skipping GUI benchmarks, no display ({error}); run under xvfb-run to include them", file=sys.stderr)
+        return []
+    root.withdraw()
+
+    app = NBAStats.__new__(NBAStats)
+    storage = tempfile.mkdtemp()
+    NBAScraper.__init__(app, cache_directory=os.path.join(storage, "cache"), history_path=os.path.join(storage, "history.db"))
+    app.root = root
+    app.current_team = TEAM
+    app.row_hashes = {}
+    # The worker thread ingests the game log before the tab is built
+    app.game_logs.ingest(app.getTeamPage(TEAM), current_season(), team_data["game_log"])
+
+    def build(render):
+        app.team_view = {}
+        tab = tk.Frame(root)
+        render(tab)
+        root.update_idletasks()
+        tab.destroy()
+
+    about = team_data["roster"]
+    franchise = team_data["franchise"]
+    tabs = {
+        "About": lambda tab: app.About(tab, about["roster"], about["coaching"], about["updates"]),
+        "Franchise": lambda tab: app.Franchise(tab, franchise["retired_numbers"], franchise["hall_of_fame"], franchise["all_time"], franchise["achievements"]),
+        "Player_Stats": lambda tab: app.Player_Stats(tab, about["roster"], team_data["player_stats"], team_data["overall_stats"]),
+        "Game_To_Game": lambda tab: app.populate_game_to_game_tab(tab, TEAM),
+    }
+    results = [run(f"render.{name}", lambda render=render: build(render), max(1, iterations // 5)) for name, render in tabs.items()]
+    app.driver_pool.shutdown()
+    root.destroy()
+    return results
+
+
+def report(results, baseline, tolerance):
+    # Print every benchmark and return the ones whose median regressed past the baseline
+    regressions = []
+    print(f"{'benchmark':<32}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'ops/s':>12}{'baseline':>11}")
+    for result in results:
+        base = baseline.get(result["name"])
+        change = ""
+        if base:
+            ratio = result["p50"] / base - 1
+            change = f"{ratio:+.0%}"
+            if ratio > tolerance:
+                regressions.append(result["name"])
+                change += " !"
+        print(f"{result['name']:<32}{result['p50'] * 1000:>10.3f}{result['p95'] * 1000:>10.3f}{result['p99'] * 1000:>10.3f}"
+              f"{result['max'] * 1000:>10.3f}{result['throughput']:>12.0f}{change:>11}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scrapers and tab builders against saved pages")
+    parser.add_argument("--fixtures", default="benchmark_fixtures", help="directory of saved pages")
+    parser.add_argument("--record", metavar="TEAM", help="save this team's live pages as the fixtures and exit")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--baseline", default="benchmark_baseline.json", help="stored medians to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run's medians as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown of a median before failing")
+    parser.add_argument("--no-gui", action="store_true", help="skip the tab builder benchmarks")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        record_fixtures(args.fixtures, args.record.lower())
+        return 0
+    if not all(os.path.exists(os.path.join(args.fixtures, f"{page}.html")) for page in FIXTURE_PAGES):
+        print(f"No recorded fixtures in {args.fixtures}, writing synthetic pages", file=sys.stderr)
+        synthesize_fixtures(args.fixtures)
+
+    from nbaScraper import NBAScraper
+
+    storage = tempfile.mkdtemp()
+    scraper = NBAScraper(cache_directory=os.path.join(storage, "cache"), history_path=os.path.join(storage, "history.db"))
+    results, team_data = scraper_benchmarks(scraper, load_fixtures(args.fixtures), args.iterations)
+    results += lookup_benchmarks(team_data, args.iterations)
+    if not args.no_gui:
+        results += gui_benchmarks(team_data, args.iterations)
+    scraper.driver_pool.shutdown()
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+    regressions = report(results, baseline, args.tolerance)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump({result["name"]: result["p50"] for result in results}, baseline_file, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    if regressions:
+        print(f"Regressed past {args.tolerance:.0%}: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+# Team Data Export:
+# Run the nba.com scrapers from the command line, without tkinter or PIL, and stream each
+# team's roster, stats and franchise tables to JSON Lines, CSV or Parquet as soon as it finishes.
+#
+#   python hoopExport.py celtics lakers --format csv --output exports/
+#   python hoopExport.py all --format jsonl > teams.jsonl
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from nbaScraper import NBAScraper, TEAM_IDS
+from teamCache import DEFAULT_TTLS
+from statsClient import STATS_URL
+
+
+def team_tables(team_data):
+    # Flatten one team's scraped data into named (header, rows) tables
+    tables = {}
+    if "roster" in team_data:
+        about = team_data["roster"]
+        tables["roster"] = (about["roster"][0], about["roster"][1:])
+        coaching = about["coaching"]
+        tables["coaching"] = (["POSITION", "NAME"], [[position, name] for position, names in zip(coaching[0], coaching[1:]) for name in names])
+        tables["updates"] = (["DATE", "HEADLINE", "CONTENT"], [[update["date"], update["headline"], update["content"]] for update in about["updates"]])
+    if "player_stats" in team_data:
+        tables["player_stats"] = (team_data["player_stats"][0], team_data["player_stats"][1:])
+    if "overall_stats" in team_data:
+        tables["overall_stats"] = (team_data["overall_stats"][0], team_data["overall_stats"][1:])
+    if "game_log" in team_data:
+        tables["game_log"] = (team_data["game_log"][0], team_data["game_log"][1:])
+    if "franchise" in team_data:
+        franchise = team_data["franchise"]
+        tables["retired_numbers"] = (franchise["retired_numbers"][0], franchise["retired_numbers"][1:])
+        tables["hall_of_fame"] = (franchise["hall_of_fame"][0], franchise["hall_of_fame"][1:])
+        tables["all_time"] = (["RECORD", "PLAYER", "VALUE"], franchise["all_time"])
+        achievements = franchise["achievements"]
+        tables["achievements"] = (["ACHIEVEMENT", "YEAR"], [[title, year] for title, years in zip(achievements[0], achievements[1:]) for year in years])
+    return tables
+
+
+class JsonLinesWriter:
+    def __init__(self, output):
+        self.file = open(output, "w", encoding="utf-8") if output and output != "-" else sys.stdout
+
+    def write(self, team, team_id, team_data):
+        self.file.write(json.dumps({"team": team, "team_id": team_id, "scraped_at": time.time(), "data": team_data}) + "\n")
+        self.file.flush()
+
+    def close(self):
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+class CsvWriter:
+    # One CSV per table in the output directory, with rows appended as each team finishes
+    def __init__(self, output):
+        self.directory = output or "exports"
+        os.makedirs(self.directory, exist_ok=True)
+        self.files = {}
+
+    def write(self, team, team_id, team_data):
+        for name, (header, rows) in team_tables(team_data).items():
+            if name not in self.files:
+                table_file = open(os.path.join(self.directory, f"{name}.csv"), "w", newline="", encoding="utf-8")
+                table_writer = csv.writer(table_file)
+                table_writer.writerow(["TEAM", "TEAM_ID"] + list(header))
+                self.files[name] = (table_file, table_writer)
+            table_file, table_writer = self.files[name]
+            table_writer.writerows([team, team_id] + list(row) for row in rows)
+            table_file.flush()
+
+    def close(self):
+        for table_file, _ in self.files.values():
+            table_file.close()
+
+
+class ParquetWriter:
+    # One Parquet file per table, with one row group written per team
+    def __init__(self, output):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            sys.exit("Parquet output needs pyarrow: pip install pyarrow")
+        self.pyarrow = pyarrow
+        self.parquet = pyarrow.parquet
+        self.directory = output or "exports"
+        os.makedirs(self.directory, exist_ok=True)
+        self.writers = {}
+
+    def write(self, team, team_id, team_data):
+        for name, (header, rows) in team_tables(team_data).items():
+            columns = ["TEAM", "TEAM_ID"] + [column or f"COLUMN_{i}" for i, column in enumerate(header)]
+            values = [[team] * len(rows), [str(team_id)] * len(rows)]
+            values += [[row[i] if i < len(row) else None for row in rows] for i in range(len(header))]
+            table = self.pyarrow.table(dict(zip(columns, values)), schema=self.pyarrow.schema([(column, self.pyarrow.string()) for column in columns]))
+            if name not in self.writers:
+                self.writers[name] = self.parquet.ParquetWriter(os.path.join(self.directory, f"{name}.parquet"), table.schema)
+            self.writers[name].write_table(table)
+
+    def close(self):
+        for writer in self.writers.values():
+            writer.close()
+
+
+WRITERS = {"jsonl": JsonLinesWriter, "csv": CsvWriter, "parquet": ParquetWriter}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export NBA team data without the GUI")
+    parser.add_argument("teams", nargs="+", help="team names as used in nba.com URLs (e.g. celtics, 76ers, blazers) or 'all'")
+    parser.add_argument("--format", choices=WRITERS, default="jsonl")
+    parser.add_argument("--output", help="output file for jsonl (default stdout), output directory for csv/parquet")
+    parser.add_argument("--kinds", nargs="+", choices=DEFAULT_TTLS, default=list(DEFAULT_TTLS), help="kinds of data to export")
+    parser.add_argument("--workers", type=int, default=1, help="teams scraped at the same time")
+    parser.add_argument("--no-cache", action="store_true", help="always scrape instead of using fresh cached data")
+    parser.add_argument("--backfill-seasons", nargs="+", metavar="SEASON", default=[],
+                        help="also scrape these past seasons (e.g. 2022-23) into the history store")
+    parser.add_argument("--stats-url", nargs="?", const=STATS_URL, default=os.environ.get("HOOPMETRICS_STATS_URL"),
+                        help="read the stats tables from the stats JSON endpoints, optionally at another base URL")
+    parser.add_argument("--metrics", help="append per-stage timings and WebDriver command counts to this JSON Lines file")
+    args = parser.parse_args(argv)
+
+    teams = list(TEAM_IDS) if args.teams == ["all"] else [team.lower() for team in args.teams]
+    unknown = [team for team in teams if team not in TEAM_IDS]
+    if unknown:
+        parser.error(f"unknown teams: {', '.join(unknown)}")
+
+    scraper = NBAScraper(stats_url=args.stats_url, metrics_path=args.metrics)
+    scraper.driver_pool.size = scraper.scrape_workers * args.workers
+    writer = WRITERS[args.format](args.output)
+    failed = 0
+    try:
+        # Write each team out as soon as its scrape finishes
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            futures = {executor.submit(scraper.collectTeam, team, args.kinds, not args.no_cache): team for team in teams}
+            for future in as_completed(futures):
+                team = futures[future]
+                try:
+                    writer.write(team, TEAM_IDS[team], future.result())
+                except Exception as error:
+                    failed += 1
+                    print(f"Could not export {team}: {error}", file=sys.stderr)
+
+            # Past seasons only feed the history store, so they run after the export has streamed out
+            if args.backfill_seasons:
+                futures = {executor.submit(scraper.backfillSeasons, team, args.backfill_seasons): team for team in teams}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as error:
+                        failed += 1
+                        print(f"Could not backfill {futures[future]}: {error}", file=sys.stderr)
+    finally:
+        writer.close()
+        scraper.driver_pool.shutdown()
+        scraper.metrics.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
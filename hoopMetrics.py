@@ -2,45 +2,103 @@
 # Examine how scoring is distributed among players in a team. 
 # Identify the top scorers, role players, and their contributions to the team's overall offensive output.
 
-import re
-from selenium import webdriver
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-
-from PIL import Image, ImageTk
+import time
+STARTED_AT = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk
 import os
-
-class NBAStats:
-    def __init__(self, root):
+import argparse
+import threading
+import queue
+
+from nbaScraper import NBAScraper
+from statTable import StatTable
+from assetCache import AssetCache
+from viewManager import ViewManager
+from virtualTable import VirtualTable
+from comparisonGrid import ComparisonGrid
+from statsClient import STATS_URL, StatsClient
+from serviceClient import ServiceClient
+from historyStore import current_season
+from gameLog import WINDOWS
+from scoringDistribution import COLUMNS as SCORING_COLUMNS, team_distribution
+
+# Seconds spent importing modules at startup
+IMPORT_SECONDS = time.perf_counter() - STARTED_AT
+
+# Rows requested on screen for a virtualized table; larger tables scroll through their row store
+VISIBLE_ROWS = 30
+
+# Per-team view state kept with a cached team view while another screen is shown
+VIEW_STATE = ("team_data", "team_view", "row_hashes", "rendered_tabs", "tab_requirements", "tab_loaders")
+
+class NBAStats(NBAScraper):
+    def __init__(self, root, metrics_path=None):
         self.root = root
         self.root.title("NBA Team Scoring Distributions")
 
+        self.active_selection = None
+        self.current_team = None
+        self.view_states = {}
+
+        # League-wide scoring distribution for the SCORING tab's league view, built on first use
+        self.league_scoring = None
+
+        # Seconds between live re-scrapes of the selected team, None to only refresh expired cache entries
+        self.live_refresh_seconds = None
+
+        # Startup phases in seconds, from process start to an interactive home screen
+        self.startup_phases = {"imports": IMPORT_SECONDS}
+        phase_start = time.perf_counter()
+        NBAScraper.__init__(self, metrics_path=metrics_path)
+
+        # Logos are decoded and resized once for the whole session
+        self.assets = AssetCache()
+        self.assets.preload()
+        self.startup_phases["init"] = time.perf_counter() - phase_start
+
+        # Screens are built once and raised on demand, keeping the most recent team views
+        phase_start = time.perf_counter()
+        self.views = ViewManager(root, max_views=5, on_evict=lambda team: self.view_states.pop(team, None))
+        self.home_frame = self.views.pin("home", self.build_home)
+        self.views.show("home")
+        self.startup_phases["home"] = time.perf_counter() - phase_start
+        self.root.after_idle(self.home_ready)
+
+    def home_ready(self):
+        # The home screen is on screen, so the slower startup work can begin
+        self.root.update_idletasks()
+        self.startup_phases["total"] = time.perf_counter() - STARTED_AT
+
+        for phase, seconds in self.startup_phases.items():
+            self.metrics.record(f"startup.{phase}", seconds)
+
+        # Warm the shared browser sessions (and load selenium) so the first click skips Chrome's cold start;
+        # a thin client of the data service never starts a browser
+        if self.service_client is None:
+            self.driver_pool.warm(self.scrape_workers)
+
+    def build_home(self, home_frame):
         # Load NBA logo image
-        nba_logo_image = Image.open("NBA_logo.png")
-        nba_logo_image = nba_logo_image.resize((100, 200))
-        self.nba_logo = ImageTk.PhotoImage(nba_logo_image)
+        self.nba_logo = self.assets.photo("NBA_logo")
 
         # Configure rows and columns to expand the content
         for i in range(16):
-            self.root.grid_rowconfigure(i, weight=1)
+            home_frame.grid_rowconfigure(i, weight=1)
         for i in range(8):
-            self.root.grid_columnconfigure(i, weight=1)
+            home_frame.grid_columnconfigure(i, weight=1)
 
         # Title Label
-        self.title_label = tk.Label(root, text="NBA Team Statistics", font=("Helvetica", 40, "bold"))
+        self.title_label = tk.Label(home_frame, text="NBA Team Statistics", font=("Helvetica", 40, "bold"))
         self.title_label.grid(row=0, column=0, columnspan=8, pady=(60, 30))
 
         # Welcome Label
-        self.welcome_label = tk.Label(root, text="Welcome, please select a team from below:", font=("Helvetica", 35))
+        self.welcome_label = tk.Label(home_frame, text="Welcome, please select a team from below:", font=("Helvetica", 35))
         self.welcome_label.grid(row=1, column=0, columnspan=8, pady=20)
 
         # NBA Logo
-        self.logo_label = tk.Label(root, image=self.nba_logo)
+        self.logo_label = tk.Label(home_frame, image=self.nba_logo)
         self.logo_label.grid(row=0, column=5, padx=0, pady=0, sticky='e')
 
         # Dictionary with NBA divisions and corresponding teams
@@ -55,42 +113,179 @@ class NBAStats:
 
         # Create buttons for each division in separate rows
         for row_num, (division, teams) in enumerate(self.divisions.items()):
-            self.create_team_buttons(division, teams, row_num * 2 + 2)
+            self.create_team_buttons(home_frame, division, teams, row_num * 2 + 2)
 
-    def create_team_buttons(self, division_name, teams, row):
-        division_label = tk.Label(self.root, text=division_name + ":", font=("Helvetica", 20, "bold"))
+        # League Comparison Button
+        league_button = tk.Button(home_frame, text="League Comparison", command=self.league_selected, padx=20, pady=10, font=("Helvetica", 16), width=15)
+        league_button.grid(row=14, column=0, columnspan=8, pady=10)
+
+    def create_team_buttons(self, home_frame, division_name, teams, row):
+        division_label = tk.Label(home_frame, text=division_name + ":", font=("Helvetica", 20, "bold"))
         division_label.grid(row=row, column=0, pady=(20, 10), sticky='e')
 
         for i, team in enumerate(teams):
-            team_button = tk.Button(self.root, text=team, command=lambda t=team: self.team_selected(t), padx=20, pady=10, font=("Helvetica", 16), width=15)
+            team_button = tk.Button(home_frame, text=team, command=lambda t=team: self.team_selected(t), padx=20, pady=10, font=("Helvetica", 16), width=15)
             team_button.grid(row=row, column=i + 2, pady=10, padx=(0, 20), sticky='w')
 
         # White line to separate divisions
-        frame = tk.Frame(self.root, bg='white', height=2, bd=0, relief='ridge')
+        frame = tk.Frame(home_frame, bg='white', height=2, bd=0, relief='ridge')
         frame.grid(row=row + 1, column=1, columnspan=6, sticky='ew')
     
     def team_selected(self, team_name):
-        # Remove labels and buttons below
-        for widget in self.root.winfo_children():
-            widget.destroy()
-
         # Team Variable
         team = team_name.split(" ")[-1]
 
+        # Raise the team's cached view, or build it the first time it is selected
+        self.save_view_state()
+        _, built = self.views.show(team, lambda team_frame: self.build_team_view(team_frame, team_name, team))
+        if not built:
+            self.restore_view_state(team)
+        self.current_team = team
+        self.selection_started = time.perf_counter()
+
+        # Scrape in a worker thread and hand results to the Tk thread through a queue; a cached view only takes the changes
+        selection = object()
+        self.active_selection = selection
+        results = queue.Queue()
+        threading.Thread(target=self.loadTeamData, args=(team, results, selection), daemon=True).start()
+        self.poll_team_data(selection, results, self.team_data)
+
+    def show_debug_overlay(self):
+        # Latest stage timings and WebDriver command counts, drawn over whichever screen is raised
+        overlay = tk.Label(self.root, justify='left', anchor='nw', bg='black', fg='lime', font=("Courier", 10))
+        overlay.place(relx=1, rely=1, anchor='se')
+
+        def update():
+            summary = self.metrics.summary()
+            lines = [f"{stage:<28}{seconds * 1000:>9.1f} ms  {' '.join(str(value) for value in labels.values())[:40]}"
+                     for stage, seconds, labels in self.metrics.recent]
+            commands = sum(count for name, count in summary["counters"].items() if name.startswith("webdriver."))
+            lines.append(f"{'webdriver commands':<28}{commands:>9}")
+            if "total" in self.startup_phases:
+                lines.append(f"{'startup':<28}{self.startup_phases['total'] * 1000:>9.1f} ms  " + " ".join(
+                    f"{phase} {seconds * 1000:.0f}" for phase, seconds in self.startup_phases.items() if phase != "total"))
+            for stage in ("team.loaded", "render"):
+                if stage in summary["stages"]:
+                    lines.append(f"{stage + ' p50/p95':<28}{summary['stages'][stage]['p50'] * 1000:>9.1f} / {summary['stages'][stage]['p95'] * 1000:.1f} ms")
+            overlay.config(text="\n".join(lines))
+            overlay.lift()
+            self.root.after(1000, update)
+        update()
+
+    def league_selected(self):
+        # The league view is built once and kept, like the home screen
+        self.save_view_state()
+        self.active_selection = None
+        self.current_team = None
+        if self.views.get("league") is None:
+            self.views.pin("league", self.build_league_view)
+        self.views.show("league")
+
+    def build_league_view(self, league_frame):
+        for i in range(4):
+            league_frame.columnconfigure(i, weight = 1)
+        league_frame.rowconfigure(3, weight = 1)
+
+        # Back Button
+        back_button = tk.Button(league_frame, text="Back", command=self.back_to_teams, padx=20, pady=10, font=("Helvetica", 16), width=15)
+        back_button.grid(row = 0, column = 0, sticky = 'w', padx = 20, pady = 20)
+
+        # League Comparison Label
+        league_label = tk.Label(league_frame, text="League Comparison", font=("Helvetica", 30, "bold"))
+        league_label.grid(row = 0, column = 1, columnspan = 2)
+
+        # Compare players or teams, names separated by commas
+        mode_box = ttk.Combobox(league_frame, values = ["Players", "Teams"], state = 'readonly', width = 10, font=("Helvetica", 14))
+        mode_box.set("Players")
+        mode_box.grid(row = 1, column = 0, sticky = 'e', padx = 10)
+        names_entry = tk.Entry(league_frame, font=("Helvetica", 14))
+        names_entry.grid(row = 1, column = 1, columnspan = 2, sticky = 'ew', padx = 10)
+        compare_button = tk.Button(league_frame, text="Compare", padx=20, pady=5, font=("Helvetica", 14))
+        compare_button.grid(row = 1, column = 3, sticky = 'w', padx = 10)
+
+        # Status Label
+        status_label = tk.Label(league_frame, text="Enter player or team names separated by commas, values show their league percentile",
+                                fg = 'lightgray', font=("Helvetica", 13))
+        status_label.grid(row = 2, column = 0, columnspan = 4, pady = 10)
+
+        # Comparison Treeview, one column per compared name
+        comparison_table = ttk.Treeview(league_frame, show = 'headings', height = VISIBLE_ROWS)
+        comparison_table.config(selectmode = "none")
+        comparison_table.grid(row = 3, column = 0, columnspan = 4, sticky = 'nsew', padx = 20, pady = (0, 20))
+
+        def show_comparison(league_tables):
+            names = [name.strip() for name in names_entry.get().split(",") if name.strip()]
+            league = league_tables["players" if mode_box.get() == "Players" else "teams"]
+            unknown = [name for name in names if league.find(name) is None]
+            rows = league.comparison_rows(names)
+            comparison_table.delete(*comparison_table.get_children())
+            comparison_table["columns"] = [f"c{i}" for i in range(len(rows[0]))]
+            for i, col in enumerate(rows[0]):
+                comparison_table.heading(f"c{i}", text=col)
+                comparison_table.column(f"c{i}", width=100 if i == 0 else 160, anchor='center')
+            for row in rows[1:]:
+                comparison_table.insert(parent = '', index = tk.END, values = row)
+            status_label.config(text=f"Not found: {', '.join(unknown)}" if unknown else f"Compared against {len(league)} league rows")
+
+        def compare():
+            # The league tables are merged on the first comparison, every later one is a lookup
+            if self.league_tables is not None:
+                show_comparison(self.league_tables)
+                return
+            status_label.config(text="Building the league table...")
+            results = queue.Queue()
+
+            def build():
+                try:
+                    # Team rows are keyed by slug ("blazers"), so the home screen's names find them too
+                    league_tables = self.leagueTables()
+                    for team_name in (team_name for teams in self.divisions.values() for team_name in teams):
+                        league_tables["teams"].alias(team_name.split(" ")[-1].lower(), team_name)
+                    results.put(league_tables)
+                except Exception as error:
+                    results.put(error)
+
+            def poll():
+                try:
+                    result = results.get_nowait()
+                except queue.Empty:
+                    self.root.after(50, poll)
+                    return
+                if isinstance(result, Exception):
+                    status_label.config(text=f"Could not build the league table: {result}")
+                else:
+                    show_comparison(result)
+
+            threading.Thread(target=build, daemon=True).start()
+            poll()
+
+        compare_button.config(command=compare)
+        names_entry.bind("<Return>", lambda _: compare())
+
+    def save_view_state(self):
+        # Keep the widgets and data of the team on screen with its cached view
+        if self.current_team is not None and self.views.get(self.current_team) is not None:
+            self.view_states[self.current_team] = {name: getattr(self, name) for name in VIEW_STATE}
+
+    def restore_view_state(self, team):
+        for name, value in self.view_states.pop(team).items():
+            setattr(self, name, value)
+
+    def build_team_view(self, team_frame, team_name, team):
         # Create Frames
-        back_frame = tk.Frame(root)
+        back_frame = tk.Frame(team_frame)
         back_frame.place(x = 0, y = 0, relwidth = 1/3, relheight = 0.1)
         back_frame.columnconfigure((0), weight = 1)
         back_frame.rowconfigure((0), weight = 1)
-        selected_frame = tk.Frame(root)
+        selected_frame = tk.Frame(team_frame)
         selected_frame.place(relx=1/3, y = 0, relwidth=1/3, relheight=0.1)
         selected_frame.columnconfigure((0), weight = 1)
         selected_frame.rowconfigure((0), weight = 1)
-        logo_frame = tk.Frame(root)
+        logo_frame = tk.Frame(team_frame)
         logo_frame.place(relx=2/3, y=0, relwidth=1/3, relheight=0.1)
         logo_frame.columnconfigure((0), weight = 1)
         logo_frame.rowconfigure((0), weight = 1)
-        notebook_frame = tk.Frame(root)
+        notebook_frame = tk.Frame(team_frame)
         notebook_frame.place(x=0, rely=0.1, relwidth=1, relheight=0.9)
         notebook_frame.columnconfigure((0), weight = 1)
         notebook_frame.rowconfigure((0), weight = 1)
@@ -104,10 +299,7 @@ class NBAStats:
         self.selected_label.grid(row=0, column=0, sticky='nsew')
 
         # Create NBA Logo Image
-        team_logo_path = os.path.join("NBA_Logos", f"{team}.png")
-        nba_team_image = Image.open(team_logo_path)
-        nba_team_image = nba_team_image.resize((100, 100))
-        self.team_logo = ImageTk.PhotoImage(nba_team_image)
+        self.team_logo = self.assets.photo(team)
         self.team_logo_label = tk.Label(logo_frame, image=self.team_logo)
         self.team_logo_label.grid(row=0, column=0,  sticky='nsew')
 
@@ -123,37 +315,285 @@ class NBAStats:
         franchise_tab = tk.Frame(self.notebook)
         player_stats_tab = tk.Frame(self.notebook)
         game_to_game_tab = tk.Frame(self.notebook)
+        scoring_tab = tk.Frame(self.notebook)
 
         self.notebook.add(about_tab, text='ABOUT')
         self.notebook.add(franchise_tab, text='FRANCHISE')
         self.notebook.add(player_stats_tab, text='PLAYER STATS')
         self.notebook.add(game_to_game_tab, text='GAME-TO-GAME')
+        self.notebook.add(scoring_tab, text='SCORING')
+
+        # Play the loading animation in each tab until its data arrives
+        self.team_data = {}
+        self.team_view = {}
+        self.row_hashes = {}
+        self.rendered_tabs = {}
+        self.tab_loaders = {tab: self.show_loading(tab) for tab in (about_tab, franchise_tab, player_stats_tab, game_to_game_tab, scoring_tab)}
+        self.tab_requirements = {
+            about_tab: (("roster",),
+                        lambda data: self.About(about_tab, data["roster"]["roster"], data["roster"]["coaching"], data["roster"]["updates"]),
+                        self.refresh_about),
+            franchise_tab: (("franchise",),
+                            lambda data: self.Franchise(franchise_tab, data["franchise"]["retired_numbers"], data["franchise"]["hall_of_fame"], data["franchise"]["all_time"], data["franchise"]["achievements"]),
+                            self.refresh_franchise),
+            player_stats_tab: (("roster", "player_stats", "overall_stats"),
+                               lambda data: self.Player_Stats(player_stats_tab, data["roster"]["roster"], data["player_stats"], data["overall_stats"]),
+                               self.refresh_player_stats),
+            game_to_game_tab: (("game_log",),
+                               lambda data: self.populate_game_to_game_tab(game_to_game_tab, team),
+                               self.refresh_game_to_game),
+            scoring_tab: (("player_stats",),
+                          lambda data: self.Scoring(scoring_tab, team, data["player_stats"]),
+                          self.refresh_scoring)
+        }
 
-        # Set up Chrome options for headless mode
-        # chrome_options = webdriver.ChromeOptions()
-        # chrome_options.add_argument("--headless=new")  # Enable headless mode
-        # chrome_options.add_argument("--disable-gpu")  # Disable GPU acceleration (necessary in headless mode)
-        # driver = webdriver.Chrome(options=chrome_options)
-        driver = webdriver.Chrome()
-
+    def show_loading(self, tab):
+        # Decode every frame of the loading gif once and reuse it for every tab
+        loading_frames = self.assets.animation("loading_gif.gif")
+
+        loading_label = tk.Label(tab)
+        loading_label.place(relx=0.5, rely=0.5, anchor='center')
+
+        def animate(frame_num=0):
+            if loading_label.winfo_exists() and loading_frames:
+                loading_label.config(image=loading_frames[frame_num])
+                self.root.after(50, animate, (frame_num + 1) % len(loading_frames))
+        animate()
+        return loading_label
+
+    def show_tab_error(self, tab, text="Could not load this team's data, please try again later."):
+        error_label = tk.Label(tab, text=text, fg='lightgray', font=("Helvetica", 15, "bold"))
+        error_label.place(relx=0.5, rely=0.5, anchor='center')
+        return error_label
+
+    def render_tab(self, tab, render, team_data):
+        # A tab that cannot be built shows an error in its place instead of ending the poll for every other tab
+        try:
+            render(team_data)
+        except Exception as error:
+            print(f"Rendering the {tab.master.tab(tab, 'text')} tab failed: {error}")
+            for widget in tab.winfo_children():
+                widget.destroy()
+            self.show_tab_error(tab, "Could not show this team's data, the page layout may have changed.")
+
+    def poll_team_data(self, selection, results, team_data):
+        # Stop polling once the user has left this team
+        if self.active_selection is not selection:
+            return
+
+        loaded = finished = False
+        updated_kinds = set()
+        while True:
+            try:
+                result = results.get_nowait()
+            except queue.Empty:
+                break
+            if result is None:
+                finished = True
+            elif result == "loaded":
+                loaded = True
+            elif isinstance(result, Exception):
+                print(f"Scraping failed: {result}")
+            else:
+                team_data.update(result)
+                updated_kinds.update(result)
+
+        # Render every tab as soon as the data it needs has arrived
+        for tab, (kinds, render, refresh) in list(self.tab_requirements.items()):
+            if all(kind in team_data for kind in kinds):
+                del self.tab_requirements[tab]
+                self.tab_loaders.pop(tab).destroy()
+                with self.metrics.timer("render", tab=tab.master.tab(tab, "text"), team=self.current_team):
+                    self.render_tab(tab, render, team_data)
+                self.rendered_tabs[tab] = (kinds, render, refresh, True)
+            elif loaded:
+                # The tab keeps waiting behind the error, so data from a later load or a revisit still renders it
+                self.tab_loaders.pop(tab).destroy()
+                self.tab_loaders[tab] = self.show_tab_error(tab)
+
+        # Patch tabs that are already on screen with only what changed, rebuilding them if their layout no longer fits
+        for tab, (kinds, render, refresh, just_rendered) in list(self.rendered_tabs.items()):
+            self.rendered_tabs[tab] = (kinds, render, refresh, False)
+            if just_rendered or not updated_kinds.intersection(kinds):
+                continue
+            with self.metrics.timer("refresh", tab=tab.master.tab(tab, "text"), team=self.current_team):
+                try:
+                    refreshed = refresh(team_data)
+                except Exception as error:
+                    print(f"Refreshing the {tab.master.tab(tab, 'text')} tab failed: {error}")
+                    refreshed = False
+                if not refreshed:
+                    for widget in tab.winfo_children():
+                        widget.destroy()
+                    self.render_tab(tab, render, team_data)
+
+        if loaded:
+            self.metrics.record("team.loaded", time.perf_counter() - self.selection_started, team=self.current_team)
+        if not finished:
+            self.root.after(50, self.poll_team_data, selection, results, team_data)
+
+    def loadTeamData(self, team, results, selection):
+        # Send cached data first so it renders immediately, then scrape the kinds that were never cached
         team_id_num = self.getTeamPage(team.lower())
-        team_roster = self.getRoster(driver, f'https://www.nba.com/team/{team_id_num}/{team.lower()}')
-        coaching_array = self.getCoachingStaff(driver, f'https://www.nba.com/team/{team_id_num}/{team.lower()}')
-        updates_array = self.getTeamUpdates(driver, f'https://www.nba.com/team/{team_id_num}/{team.lower()}')
-        player_specifc_stats = self.getPlayerStats(driver, f'https://www.nba.com/stats/team/{team_id_num}/players-traditional')
-        overall_stats = self.getOverallStats(driver, f'https://www.nba.com/stats/team/{team_id_num}/traditional')
-        retired_numbers = self.getRetiredNumbers(driver, f'https://www.nba.com/team/{team_id_num}/{team.lower()}')
-        hall_of_fame = self.getHallOfFame(driver, f'https://www.nba.com/team/{team_id_num}/{team.lower()}')
-        all_time = self.getAllTime(driver, f'https://www.nba.com/team/{team_id_num}/{team.lower()}')
-        achievements = self.getAchievements(driver, f'https://www.nba.com/team/{team_id_num}/{team.lower()}')
-
-        # About Tab
-        self.About(about_tab, team_roster, coaching_array, updates_array)
-        self.Franchise(franchise_tab, retired_numbers, hall_of_fame, all_time, achievements)
-        self.Player_Stats(player_stats_tab, team_roster, player_specifc_stats, overall_stats)
-        # self.populate_game_to_game_tab(game_to_game_tab, team)
-        print("DONE")
 
+        # Game logs are stored here rather than on the Tk thread, which only reads the ingested log;
+        # games already stored are skipped, so a page recordHistory ingested costs one lookup.
+        # A log that cannot be stored leaves the tab on what was stored before instead of stopping the worker
+        def ingest_game_log(data):
+            if "game_log" in data:
+                try:
+                    self.game_logs.ingest(team_id_num, current_season(), data["game_log"])
+                except Exception as error:
+                    print(f"Storing the {team} game log failed: {error}")
+
+        team_data, stale = self.team_cache.load_team(team_id_num)
+        ingest_game_log(team_data)
+        results.put(team_data)
+        missing = [kind for kind in stale if kind not in team_data]
+
+        def page_scraped(page_data):
+            for kind, data in page_data.items():
+                self.team_cache.put(team_id_num, kind, data)
+            ingest_game_log(page_data)
+            results.put(page_data)
+
+        try:
+            if missing:
+                self.scrapeTeam(team, missing, page_scraped)
+        except Exception as error:
+            results.put(error)
+        results.put("loaded")
+
+        # Refresh expired kinds and apply them to the tabs already on screen
+        stale = [kind for kind in stale if kind not in missing]
+        try:
+            if stale:
+                self.scrapeTeam(team, stale, page_scraped)
+
+            # In live mode keep re-scraping the fast-moving kinds while this team stays selected
+            while self.live_refresh_seconds and self.active_selection is selection:
+                time.sleep(self.live_refresh_seconds)
+                if self.active_selection is selection:
+                    self.scrapeTeam(team, ("roster", "player_stats", "overall_stats"), page_scraped)
+        except Exception as error:
+            print(f"Refreshing {team} failed: {error}")
+        results.put(None)
+
+    def sync_table(self, table, rows):
+        # Virtual tables swap their row store and only re-render the rows on screen
+        if isinstance(table, VirtualTable):
+            table.set_rows(rows)
+            return
+
+        # Apply only the rows that changed since the Treeview was last filled
+        row_hashes = self.row_hashes.setdefault(str(table), [])
+        items = table.get_children()
+        for i, row in enumerate(rows):
+            row_hash = hash(tuple(row))
+            if i < len(items):
+                if row_hashes[i] != row_hash:
+                    table.item(items[i], values=row)
+                    row_hashes[i] = row_hash
+            else:
+                table.insert(parent = '', index = tk.END, values = row)
+                row_hashes.append(row_hash)
+        if len(items) > len(rows):
+            table.delete(*items[len(rows):])
+            del row_hashes[len(rows):]
+        if len(items) != len(rows):
+            table.config(height = len(rows) + 1)
+
+    def sync_labels(self, labels, texts):
+        # Re-text only the labels that changed; False means the layout has to be rebuilt
+        if len(labels) != len(texts):
+            return False
+        for label_text, text in zip(labels, texts):
+            if label_text[1] != text:
+                label_text[0].config(text=text)
+                label_text[1] = text
+        return True
+
+    def coaching_texts(self, coaching_array):
+        texts = []
+        for i in range(len(coaching_array[0])):
+            texts.append(f'{coaching_array[0][i]}:')
+            texts.extend(f'{coach}' for coach in coaching_array[1:][i])
+        return texts
+
+    def updates_texts(self, updates_array):
+        texts = []
+        for update in updates_array:
+            texts.extend([f"{update.get('date')}", f"{update.get('headline')}", update.get('content')])
+        return texts
+
+    def all_time_texts(self, all_time):
+        return [text for row in all_time for text in row[:3]]
+
+    def achievements_texts(self, achievements):
+        texts = []
+        for title, years in zip(achievements[0], achievements[1:]):
+            texts.extend([title, ', '.join(years)])
+        return texts
+
+    def refresh_about(self, team_data):
+        about = team_data["roster"]
+        self.sync_table(self.team_view["roster_table"], about["roster"][1:])
+        if not self.sync_labels(self.team_view["coaching_labels"], self.coaching_texts(about["coaching"])):
+            return False
+
+        # Team updates only change when a new dated headline shows up
+        seen_updates = [(update.get('date'), update.get('headline')) for update in about["updates"]]
+        if seen_updates == self.team_view["seen_updates"]:
+            return True
+        self.team_view["seen_updates"] = seen_updates
+        return self.sync_labels(self.team_view["update_labels"], self.updates_texts(about["updates"]))
+
+    def refresh_player_stats(self, team_data):
+        # Live data never replaces an earlier season picked from the history
+        if self.team_view["season"] != current_season():
+            return True
+        team_roster = team_data["roster"]["roster"]
+        self.team_view["team_roster"] = team_roster
+        self.team_view["player_stats"] = StatTable(team_data["player_stats"])
+        self.sync_table(self.team_view["roster_table_1"], [row[:3] for row in team_roster[1:]])
+        self.sync_table(self.team_view["roster_table_2"], [row[:3] for row in team_roster[1:]])
+        self.sync_table(self.team_view["team_stats"], StatTable(team_data["overall_stats"]).rows)
+        return True
+
+    def refresh_franchise(self, team_data):
+        franchise = team_data["franchise"]
+        self.sync_table(self.team_view["retired_numbers_table"], franchise["retired_numbers"][1:])
+        self.sync_table(self.team_view["hall_of_fame_table"], franchise["hall_of_fame"][1:])
+        return (self.sync_labels(self.team_view["all_time_labels"], self.all_time_texts(franchise["all_time"]))
+                and self.sync_labels(self.team_view["achievements_labels"], self.achievements_texts(franchise["achievements"])))
+
+    def rolling_texts(self, game_log):
+        texts = []
+        for stat, windows in game_log.last().items():
+            texts.append(stat)
+            texts.extend(f"L{window}: {average:.1f}" for window, average in windows.items())
+        return texts
+
+    def refresh_game_to_game(self, team_data):
+        # Only the games played since the last scrape are parsed and averaged
+        game_log = self.game_logs.log(self.getTeamPage(self.current_team.lower()), current_season())
+        self.sync_table(self.team_view["game_log_table"], game_log.rows())
+        return self.sync_labels(self.team_view["rolling_labels"], self.rolling_texts(game_log))
+
+    def scoring_texts(self, distribution, team):
+        summary = distribution.summary(team)
+        texts = ["Gini Index:", f"{summary['gini']:.3f}", "Top 3 Share:", f"{summary['top_3_share']:.1%}"]
+        for tier, count in summary["tiers"].items():
+            texts.extend([f"{tier}s:", f"{count}"])
+        return texts
+
+    def refresh_scoring(self, team_data):
+        # The league view keeps its rows, only this team's concentration follows the live data
+        distribution = team_distribution(self.current_team, team_data["player_stats"])
+        self.team_view["scoring_stats"] = team_data["player_stats"]
+        if self.team_view["scoring_mode"] == "Team":
+            self.sync_table(self.team_view["scoring_table"], distribution.rows())
+        return self.sync_labels(self.team_view["scoring_labels"], self.scoring_texts(distribution, self.current_team))
 
     def About(self, tab, team_roster, coaching_array, updates_array):
         # Update the GUI again
@@ -170,7 +610,7 @@ class NBAStats:
         roster_label.grid(row = 0, column = 0, sticky = 'nsw')
 
         # Roster Treeview
-        roster_table = ttk.Treeview(roster_frame, columns = team_roster[0], show = 'headings', height = len(team_roster))
+        roster_table = VirtualTable(roster_frame, columns = team_roster[0], height = min(len(team_roster), VISIBLE_ROWS))
         roster_table.config(selectmode = "none")
         roster_table.grid(row = 1, column = 0, rowspan = 4, sticky = 'nsew')
 
@@ -190,8 +630,8 @@ class NBAStats:
         roster_table.column(team_roster[0][8], width=80)
 
         # Add data to Treeview
-        for row in team_roster[1:]:
-            roster_table.insert(parent = '', index = tk.END, values = row)
+        self.sync_table(roster_table, team_roster[1:])
+        self.team_view["roster_table"] = roster_table
 
         # Add Coaching Frame
         coaching_frame = tk.Frame(tab, bg = "#404040")
@@ -208,14 +648,18 @@ class NBAStats:
         coaching_label.grid(row = 0, column = 0,sticky = 'nsw')
 
         # Coaching Staff
+        coaching_labels = []
         row_num = 1
         for i in range(len(coaching_array[0])):
             pos = tk.Label(coaching_frame, text=f'{coaching_array[0][i]}:', bg="#404040", fg="white", font=("Helvetica", 14, "bold"))
             pos.grid(row=row_num, column=0, sticky="nsw")
+            coaching_labels.append([pos, pos.cget('text')])
             for j in range(len(coaching_array[1:][i])):
                 coach = tk.Label(coaching_frame, text=f'{coaching_array[1:][i][j]}', bg="#404040", fg="white", padx=10, font=("Helvetica", 13))
                 coach.grid(row=row_num, column=1, columnspan=2, sticky="nsw")
+                coaching_labels.append([coach, coach.cget('text')])
                 row_num += 1
+        self.team_view["coaching_labels"] = coaching_labels
 
         # Add Updates Frame
         updates_frame = tk.Frame(tab, bg='black')
@@ -232,20 +676,29 @@ class NBAStats:
         updates_label.grid(row = 0, column = 0, sticky = 'nsw')
 
         # Updates
+        update_labels = []
         row_num = 1
-        for i in range(len(updates_array[0])):
-            time = tk.Label(updates_frame, text=f"{updates_array[i].get('date')}", bg="black", fg="darkgray", padx=5, font=("Helvetica", 11))
+        for update in updates_array:
+            time = tk.Label(updates_frame, text=f"{update.get('date')}", bg="black", fg="darkgray", padx=5, font=("Helvetica", 11))
             time.grid(row=row_num, column=0, columnspan=3, sticky="sw")
-            header = tk.Label(updates_frame, text=f"{updates_array[i].get('headline')}", bg="black", fg="white", padx=5, font=("Helvetica", 13, "bold"))
+            header = tk.Label(updates_frame, text=f"{update.get('headline')}", bg="black", fg="white", padx=5, font=("Helvetica", 13, "bold"))
             header.grid(row=row_num+1, column=0, columnspan=3, sticky="nsw")
-            content = tk.Label(updates_frame, text=updates_array[i].get('content'), bg='black', fg='white', padx=5, font=("Helvetica", 12), wraplength=800, justify='left')
+            content = tk.Label(updates_frame, text=update.get('content'), bg='black', fg='white', padx=5, font=("Helvetica", 12), wraplength=800, justify='left')
             content.grid(row=row_num+2, column=0, columnspan=3, sticky='new')
+            update_labels.extend([[time, time.cget('text')], [header, header.cget('text')], [content, content.cget('text')]])
             row_num += 3
+        self.team_view["update_labels"] = update_labels
+        self.team_view["seen_updates"] = [(update.get('date'), update.get('headline')) for update in updates_array]
 
     def Player_Stats(self, tab, team_roster, player_stats, overall_stats):
         # Update the GUI again
         self.root.update_idletasks()
 
+        # Parse the stat tables into typed columns once per render, refreshes swap them in place
+        self.team_view["player_stats"] = StatTable(player_stats)
+        self.team_view["team_roster"] = team_roster
+        overall_stats = StatTable(overall_stats).as_lists()
+
         # Player 1 Frame
         player_1_frame = tk.Frame(tab)
         player_1_frame.place(x = 0, y = 0, relwidth = 0.2, relheight = 0.55)
@@ -272,8 +725,8 @@ class NBAStats:
         
 
         # Add data to Treeview
-        for row in team_roster[1:]:
-            roster_table_1.insert(parent = '', index = tk.END, values = row[:3])
+        self.sync_table(roster_table_1, [row[:3] for row in team_roster[1:]])
+        self.team_view["roster_table_1"] = roster_table_1
 
         # Player 2 Frame
         player_2_frame = tk.Frame(tab)
@@ -300,8 +753,37 @@ class NBAStats:
         roster_table_2.column(team_roster[0][2], width=45)
 
         # Add data to Treeview
-        for row in team_roster[1:]:
-            roster_table_2.insert(parent = '', index = tk.END, values = row[:3])
+        self.sync_table(roster_table_2, [row[:3] for row in team_roster[1:]])
+        self.team_view["roster_table_2"] = roster_table_2
+
+        # Comparison Frame, built once and re-filled on every selection
+        comparison_frame = tk.Frame(tab)
+        comparison_frame.place(relx = 0.35, y = 0, relwidth = 0.3, relheight = 0.7)
+        comparison_frame.columnconfigure((0), weight = 1)
+        comparison_frame.rowconfigure((0, 1, 2, 3, 4), weight = 1)
+
+        # Comparison Label
+        comparison_label = tk.Label(comparison_frame, text="--PLAYER COMPARISON--", fg = 'lightgray', font=("Helvetica", 15, "bold"))
+        comparison_label.grid(row = 0, column = 0, sticky = 'nsew')
+
+        # Comparison Grid, colored per cell
+        comparison_grid = ComparisonGrid(comparison_frame)
+        comparison_grid.grid(row = 1, column = 0, rowspan = 4, sticky = 'nsew')
+        self.team_view["comparison_grid"] = comparison_grid
+
+        # Add Legend Frame
+        legend_frame = tk.Frame(tab)
+        legend_frame.place(relx = 0.35, rely = 0.7, relwidth = 0.3, relheight = 0.075)
+        legend_frame.columnconfigure((0,), weight = 1)
+        legend_frame.rowconfigure((0, 1, 2), weight = 1)
+
+        # Add Legend Label
+        green_label = tk.Label(legend_frame, text="GREEN:  PLAYER 1  >  PLAYER 2", fg = 'green', font=("Helvetica", 12, "bold"))
+        green_label.grid(row = 0, column = 0, sticky = 'nsew', pady=3)
+        red_label = tk.Label(legend_frame, text="RED:  PLAYER 1  <  PLAYER 2", fg = 'red', font=("Helvetica", 12))
+        red_label.grid(row = 1, column = 0, sticky = 'nsew', pady=3)
+        white_label = tk.Label(legend_frame, text="WHITE:  PLAYER 1  =  PLAYER 2", fg = 'white', font=("Helvetica", 12))
+        white_label.grid(row = 2, column = 0, sticky = 'nsew', pady=3)
 
         # Each Treeview Selection
         selection_array = [team_roster[1][0], team_roster[2][0]]
@@ -319,7 +801,7 @@ class NBAStats:
         team_stats_label.grid(row = 0, column = 0, sticky = 'nsw')
 
         # Team Stats Treeview
-        team_stats = ttk.Treeview(team_stats_frame, columns = overall_stats[0], show = 'headings', height = len(overall_stats))
+        team_stats = VirtualTable(team_stats_frame, columns = overall_stats[0], height = min(len(overall_stats), VISIBLE_ROWS))
         team_stats.config(selectmode = 'none')
         team_stats.grid(row = 1, column = 0, rowspan = 4, columnspan = 4, sticky = 'nsew')
 
@@ -334,79 +816,62 @@ class NBAStats:
             team_stats.heading(col, text=col)
 
         # Add data to Treeview
-        for row in overall_stats[1:]:
-            team_stats.insert('', tk.END, values=row)
+        self.sync_table(team_stats, overall_stats[1:])
+        self.team_view["team_stats"] = team_stats
+
+        # Season Selector, earlier seasons are read from the history store, the service's in thin client mode
+        team = self.current_team
+        try:
+            seasons = self.historySeasons(team)
+        except Exception as error:
+            print(f"Reading the recorded seasons of {team} failed: {error}")
+            seasons = []
+        if current_season() not in seasons:
+            seasons.insert(0, current_season())
+        self.team_view["season"] = current_season()
+        season_box = ttk.Combobox(team_stats_frame, values = seasons, state = 'readonly', width = 10)
+        season_box.set(current_season())
+        season_box.grid(row = 0, column = 3, sticky = 'nse')
+
+        def season_select(_):
+            season = season_box.get()
+            try:
+                snapshot = self.historySnapshot(team, season)
+            except Exception as error:
+                print(f"Reading the {season} stats of {team} failed: {error}")
+                return
+            season_players, season_overall = snapshot.get("player_stats"), snapshot.get("overall_stats")
+            if season_players is None or season_overall is None:
+                return
+            self.team_view["season"] = season
+            self.team_view["player_stats"] = StatTable(season_players)
+            self.sync_table(team_stats, StatTable(season_overall).rows)
+
+        season_box.bind("<<ComboboxSelected>>", season_select)
 
         def player_select(_, tab, table, i, selection_array):
             selected_item = table.selection()[0]  # Get the selected item (assuming single selection)
             index = table.index(selected_item)  # Get the index of the selected item
-            player = team_roster[index + 1][0]
+            player = self.team_view["team_roster"][index + 1][0]
             selection_array[i] = player
+            player_stats = self.team_view["player_stats"]
 
             player_1_stats = self.getPlayer(selection_array[0], player_stats)
             player_2_stats = self.getPlayer(selection_array[1], player_stats)
-
-            # Add Comparison Frame
-            comparison_frame = tk.Frame(tab)
-            comparison_frame.place(relx = 0.35, y = 0, relwidth = 0.3, relheight = 0.7)
-            comparison_frame.columnconfigure((0), weight = 1)
-            comparison_frame.rowconfigure((0, 1, 2, 3, 4), weight = 1)
-
-            # Comparison Label
-            comparison_label = tk.Label(comparison_frame, text="--PLAYER COMPARISON--", fg = 'lightgray', font=("Helvetica", 15, "bold"))
-            comparison_label.grid(row = 0, column = 0, sticky = 'nsew')
-
-            # Comparison Treeview
-            comparison_table = ttk.Treeview(comparison_frame, columns = ["PLAYER 1", "", "PLAYER 2"], show = 'headings', height = len(player_1_stats))
-            comparison_table.config(selectmode="none")
-            comparison_table.grid(row = 1, column = 0, rowspan = 4, sticky = 'nsew')
-
-            # Add Column Names to Treeview
-            comparison_table.heading("PLAYER 1", text='PLAYER 1')
-            comparison_table.heading("", text='')
-            comparison_table.heading("PLAYER 2", text='PLAYER 2')
-            
-            # Add Column Widths
-            comparison_table.column("PLAYER 1", width=120, anchor='e')
-            comparison_table.column("", width=100, anchor='center')
-            comparison_table.column("PLAYER 2", width=120, anchor='w')
-
-            # Add Legend Frame
-            legend_frame = tk.Frame(tab)
-            legend_frame.place(relx = 0.35, rely = 0.7, relwidth = 0.3, relheight = 0.075)
-            legend_frame.columnconfigure((0,), weight = 1)
-            legend_frame.rowconfigure((0, 1, 2), weight = 1)
-
-            # Add Legend Label
-            green_label = tk.Label(legend_frame, text="GREEN:  PLAYER 1  >  PLAYER 2", fg = 'green', font=("Helvetica", 12, "bold"))
-            green_label.grid(row = 0, column = 0, sticky = 'nsew', pady=3)
-            red_label = tk.Label(legend_frame, text="RED:  PLAYER 1  <  PLAYER 2", fg = 'red', font=("Helvetica", 12))
-            red_label.grid(row = 1, column = 0, sticky = 'nsew', pady=3)
-            white_label = tk.Label(legend_frame, text="WHITE:  PLAYER 1  =  PLAYER 2", fg = 'white', font=("Helvetica", 12))
-            white_label.grid(row = 2, column = 0, sticky = 'nsew', pady=3)
-
-            # Add data to Treeview
-            comparison_table.insert(parent = '', index = tk.END, values = [player_1_stats[0], player_stats[0][0], player_2_stats[0]])
-            for i in range(len(player_1_stats)-1):
-                if float(player_1_stats[i+1]) > float(player_2_stats[i+1]):
-                    color_player_1 = 'green'
-                    color_player_2 = 'red'
-                elif float(player_1_stats[i+1]) < float(player_2_stats[i+1]):
-                    color_player_1 = 'red'
-                    color_player_2 = 'green'
+            player_1_numbers = player_stats.numbers(selection_array[0])
+            player_2_numbers = player_stats.numbers(selection_array[1])
+
+            # Compare the values parsed when the table was built, text columns are never colored
+            rows = [(player_1_stats[0], player_stats.header[0], player_2_stats[0], "equal", "equal")]
+            for i in range(1, len(player_1_stats)):
+                if player_1_numbers[i] is None or player_1_numbers[i] == player_2_numbers[i]:
+                    outcomes = ("equal", "equal")
+                elif player_1_numbers[i] > player_2_numbers[i]:
+                    outcomes = ("better", "worse")
                 else:
-                    color_player_1 = 'white'
-                    color_player_2 = 'white'
-
-                tag_player_1 = f'col{i+1}_player_1'
-                tag_player_2 = f'col{i+1}_player_2'
-
-                comparison_table.tag_configure(tag_player_1, foreground=color_player_1)
-                comparison_table.tag_configure(tag_player_2, foreground=color_player_2)
-
-                item_id = comparison_table.insert(parent='', index=tk.END, values=[player_1_stats[i+1], player_stats[0][i+1], player_2_stats[i+1]])
-
-                comparison_table.item(item_id, tags=(tag_player_1, tag_player_2))
+                    outcomes = ("worse", "better")
+                rows.append((player_1_stats[i], player_stats.header[i], player_2_stats[i]) + outcomes)
+            self.team_view["comparison_grid"].set_rows(rows)
 
     def Franchise(self, tab, retired_numbers, hall_of_fame, all_time, achievements):
         # Update the GUI again
@@ -423,7 +888,7 @@ class NBAStats:
         retired_numbers_label.grid(row = 0, column = 0, sticky = 'nsw', pady = 5)
 
         # Retired Numbers Treeview
-        retired_numbers_table= ttk.Treeview(retired_numbers_frame, columns = retired_numbers[0], show = 'headings', height = len(retired_numbers))
+        retired_numbers_table= VirtualTable(retired_numbers_frame, columns = retired_numbers[0], height = min(len(retired_numbers), VISIBLE_ROWS))
         retired_numbers_table.config(selectmode="none")
         retired_numbers_table.grid(row = 1, column = 0, rowspan = 50, sticky = 'nsew')
 
@@ -439,8 +904,8 @@ class NBAStats:
         retired_numbers_table.column(retired_numbers[0][4], width=60)
 
         # Add data to Treeview
-        for row in retired_numbers[1:]:
-            retired_numbers_table.insert(parent = '', index = tk.END, values = row)
+        self.sync_table(retired_numbers_table, retired_numbers[1:])
+        self.team_view["retired_numbers_table"] = retired_numbers_table
 
         # Hall of Fame Frame
         hall_of_fame_frame = tk.Frame(tab)
@@ -453,7 +918,7 @@ class NBAStats:
         hall_of_fame_label.grid(row = 0, column = 0, sticky = 'nsw', pady = 5)
 
         # Hall of Fame Treeview
-        hall_of_fame_table= ttk.Treeview(hall_of_fame_frame, columns = hall_of_fame[0], show = 'headings', height = len(hall_of_fame))
+        hall_of_fame_table= VirtualTable(hall_of_fame_frame, columns = hall_of_fame[0], height = min(len(hall_of_fame), VISIBLE_ROWS))
         hall_of_fame_table.config(selectmode="none")
         hall_of_fame_table.grid(row = 1, column = 0, rowspan = 50, sticky = 'nsew')
 
@@ -468,8 +933,8 @@ class NBAStats:
         hall_of_fame_table.column(hall_of_fame[0][3], width=60)
 
         # Add data to Treeview
-        for row in hall_of_fame[1:]:
-            hall_of_fame_table.insert(parent = '', index = tk.END, values = row)
+        self.sync_table(hall_of_fame_table, hall_of_fame[1:])
+        self.team_view["hall_of_fame_table"] = hall_of_fame_table
 
         # All Time Frame
         all_time_frame = tk.Frame(tab, bg="#404040")
@@ -485,6 +950,7 @@ class NBAStats:
         all_time_label.grid(row = 0, column = 0, sticky = 'nsw')
 
         # All Time
+        all_time_labels = []
         row_num = 1
         for i in range(len(all_time)):
             stat = tk.Label(all_time_frame, text=all_time[i][0], bg="#404040", fg="white", font=("Helvetica", 15, "bold"))
@@ -493,7 +959,9 @@ class NBAStats:
             name.grid(row=row_num, column=1, sticky="nsew")
             num = tk.Label(all_time_frame, text=all_time[i][2], bg="#404040", fg="white", font=("Helvetica", 15))
             num.grid(row=row_num, column=2, sticky="nsew")
+            all_time_labels.extend([[stat, stat.cget('text')], [name, name.cget('text')], [num, num.cget('text')]])
             row_num += 1
+        self.team_view["all_time_labels"] = all_time_labels
 
         # Achievements Frame
         achievements_frame = tk.Frame(tab, bg='black')
@@ -508,204 +976,223 @@ class NBAStats:
         dummy_label.grid(row = 0, column = 1, sticky = 'nsew')
 
         # Achievements
+        achievements_labels = []
         row_num = 1
-        for i in range(3):
-            title = tk.Label(achievements_frame, text=achievements[0][i], background="black", fg="white", font=("Helvetica", 15, "bold"))
+        for title_str, years_list in zip(achievements[0], achievements[1:]):
+            title = tk.Label(achievements_frame, text=title_str, background="black", fg="white", font=("Helvetica", 15, "bold"))
             title.grid(row = row_num, column = 0, sticky="nsew")
-            years_str = ', '.join(achievements[1:][i])
+            years_str = ', '.join(years_list)
             years = tk.Label(achievements_frame, text=years_str, background="black", fg="white", font=("Helvetica", 15, "bold"), wraplength=400)
             years.grid(row = row_num, column = 1, rowspan=3, sticky="nsew")
+            achievements_labels.extend([[title, title.cget('text')], [years, years.cget('text')]])
             row_num += 3
+        self.team_view["achievements_labels"] = achievements_labels
 
-    def getPlayer(self, player, player_stats):
-        for each in player_stats[1:]:
-            if player == each[0]:
-                return each
-        no_games = [player]
-        for _ in range(len(player_stats)-1):
-            no_games.append(0)
-        return no_games
+    def populate_game_to_game_tab(self, tab, team):
+        # Update the GUI again
+        self.root.update_idletasks()
 
-        
-    def back_to_teams(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        self.__init__(self.root)
-
-    def getTeamPage(self, team_name):
-        id_dict = {"hawks": 1610612737, "celtics": 1610612738, "cavaliers": 1610612739, "pelicans": 1610612740, "bulls": 1610612741, "mavericks": 1610612742
-                   , "nuggets": 1610612743, "warriors": 1610612744, "rockets": 1610612745, "clippers": 1610612746, "lakers": 1610612747, "heat": 1610612748
-                   , "bucks": 1610612749, "timberwolves": 1610612750, "nets": 1610612751, "knicks": 1610612752, "magic": 1610612753, "pacers": 1610612754
-                   , "76ers": 1610612755, "suns": 1610612756, "blazers": 1610612757, "kings": 1610612758, "spurs": 1610612759, "thunder": 1610612760
-                   , "raptors": 1610612761, "jazz": 1610612762, "grizzlies": 1610612763, "wizards": 1610612764, "pistons": 1610612765, "hornets": 1610612766}
-        return id_dict.get(team_name)
-    
-    def getRecord(self, driver, team_page_str):
-        driver.get(team_page_str)
-        record_name = driver.find_element(By.CLASS_NAME, "TeamHeader_record__wzofp")
-        all_stats_2D = driver.find_elements(By.CLASS_NAME, "TeamHeader_rank__lMnzF")
-        
-        stat_line = ""
-        for stat_element in all_stats_2D:
-            stat_text_array = stat_element.text.split("\n")
-            stat_line += stat_text_array[2] + " " + stat_text_array[0] + " ~ " + stat_text_array[1]
-            
-            if stat_element != all_stats_2D[-1]:
-                stat_line += "  |  "
-
-        return [record_name.text, stat_line]
-    
-    def getRoster(self, driver, team_page_str):
-        driver.get(team_page_str)
-        table = driver.find_element(By.TAG_NAME, 'table')
-
-        header = []
-        for row in table.find_elements(By.TAG_NAME, 'th'):
-            header.append(row.text)
- 
-        table_data = []
-        for row in table.find_elements(By.TAG_NAME, 'tr'):
-            row_data = []
-            for col in row.find_elements(By.TAG_NAME, 'td'):
-                row_data.append(col.text)
-            table_data.append(row_data)
-
-        return [header] + table_data[1:]
-    
-    def getCoachingStaff(self, driver, team_page_str):
-        driver.get(team_page_str)
-        container = driver.find_element(By.CLASS_NAME, "TeamProfile_sectionCoaches__e66bL")
-
-        header = []
-        for each in container.find_elements(By.TAG_NAME, 'h3'):
-            header.append(each.text)
-
-        coaching_data = []
-        for row in container.find_elements(By.TAG_NAME, 'ul'):
-            row_data = []
-            for col in row.find_elements(By.TAG_NAME, 'li'):
-                row_data.append(col.text)
-            coaching_data.append(row_data)
-
-        return [header] + coaching_data
-    
-    def getTeamUpdates(self, driver, team_page_str):
-        driver.get(team_page_str)
-
-        updates = []
-
-        dates = driver.find_elements(By.CLASS_NAME, 'TeamFantasyNews_articleDate__SrBm7')
-        headlines = driver.find_elements(By.CLASS_NAME, 'TeamFantasyNews_articleHeadline__02sbs')
-        contents = driver.find_elements(By.CLASS_NAME, 'TeamFantasyNews_articleContent__x7vps')
-
-        for date, headline, content in zip(dates, headlines, contents):
-            update = {
-                'date': date.text,
-                'headline': headline.text,
-                'content': content.text
-            }
-            updates.append(update)
-
-        return updates
-    def getPlayerStats(self, driver, team_page_str):
-        driver.get(team_page_str)
-        table = driver.find_elements(By.CLASS_NAME, 'Crom_table__p1iZz')[-1]
-
-        header = []
-        for row in table.find_elements(By.TAG_NAME, 'th'):
-            header.append(row.text)
-
-        table_data = []
-        for row in table.find_elements(By.TAG_NAME, 'tr'):
-            row_data = []
-            for col in row.find_elements(By.TAG_NAME, 'td'):
-                row_data.append(col.text)
-            table_data.append(row_data)
-
-        return [header] + table_data[1:]
-    
-    def getOverallStats(self, driver, team_page_str):
-        driver.get(team_page_str)
-        tables = driver.find_elements(By.CLASS_NAME, 'Crom_table__p1iZz')[:3]
-
-        header = []
-        for row in tables[0].find_elements(By.TAG_NAME, 'th'):
-            header.append(row.text)
-        header[0] = ""
-        all_data = []
-        for table in tables:
-            for row in table.find_elements(By.TAG_NAME, 'tr')[1:]:
-                row_data = []
-                
-                for col in row.find_elements(By.TAG_NAME, 'td'):
-                    row_data.append(col.text)
-                
-                all_data.append(row_data)
-        
-        return [header] + all_data
-    
-    def getRetiredNumbers(self, driver, team_page_str):
-        driver.get(team_page_str)
-        table = driver.find_element(By.CLASS_NAME, 'TeamRetired_content__nb7Qt')
-
-        header = []
-        for row in table.find_elements(By.TAG_NAME, 'th'):
-            header.append(row.text)
-        table_data = []
-        for row in table.find_elements(By.TAG_NAME, 'tr'):
-            row_data = []
-            for col in row.find_elements(By.TAG_NAME, 'td'):
-                row_data.append(col.text)
-            table_data.append(row_data)
-
-        return [header] + table_data[1:]
-    
-    def getHallOfFame(self, driver, team_page_str):
-        driver.get(team_page_str)
-        table = driver.find_element(By.CLASS_NAME, 'TeamHallOfFame_content__IZSl2')
-
-        header = []
-        for row in table.find_elements(By.TAG_NAME, 'th'):
-            header.append(row.text)
-        table_data = []
-        for row in table.find_elements(By.TAG_NAME, 'tr'):
-            row_data = []
-            for col in row.find_elements(By.TAG_NAME, 'td'):
-                row_data.append(col.text)
-            table_data.append(row_data)
-
-        return [header] + table_data[1:]
-    
-    def getAllTime(self, driver, team_page_str):
-        driver.get(team_page_str)
-        table = driver.find_element(By.CLASS_NAME, 'TeamRecords_table__0iapO')
-
-        table_data = []
-        for row in table.find_elements(By.TAG_NAME, 'tr'):
-            row_data = []
-            for col in row.find_elements(By.TAG_NAME, 'td'):
-                row_data.append(col.text)
-            table_data.append(row_data)
-
-        return table_data
-    
-    def getAchievements(self, driver, team_page_str):
-        driver.get(team_page_str)
-        rows = driver.find_elements(By.CLASS_NAME, 'TeamAwards_group__XU0o9')
+        # The worker has already appended the new games to the store's log and its rolling averages
+        game_log = self.game_logs.log(self.getTeamPage(team.lower()), current_season())
+
+        # Rolling Averages Frame
+        rolling_frame = tk.Frame(tab, bg="#404040")
+        rolling_frame.place(x = 0, y = 0, relwidth = 1, relheight = 0.2)
+        rolling_frame.columnconfigure(tuple(range(len(WINDOWS) + 1)), weight = 1)
+        rolling_frame.rowconfigure(tuple(range(len(game_log.averages) + 1)), weight = 1)
+
+        # Rolling Averages Label
+        rolling_label = tk.Label(rolling_frame, text="--ROLLING AVERAGES--", fg = 'lightgray', font=("Helvetica", 15, "bold"))
+        rolling_label.grid(row = 0, column = 0, sticky = 'nsw')
+
+        # Rolling Averages, one row per stat and one column per window
+        rolling_labels = []
+        texts = self.rolling_texts(game_log)
+        for i, text in enumerate(texts):
+            row_num, col = divmod(i, len(WINDOWS) + 1)
+            label = tk.Label(rolling_frame, text=text, bg="#404040", fg="white", font=("Helvetica", 14, "bold" if col == 0 else "normal"))
+            label.grid(row = row_num + 1, column = col, sticky = "nsw")
+            rolling_labels.append([label, label.cget('text')])
+        self.team_view["rolling_labels"] = rolling_labels
+
+        # Game Log Frame
+        game_log_frame = tk.Frame(tab)
+        game_log_frame.place(x = 0, rely = 0.2, relwidth = 1, relheight = 0.8)
+        game_log_frame.columnconfigure((0), weight = 1)
+        game_log_frame.rowconfigure((0, 1, 2, 3, 4), weight = 1)
+
+        # Game Log Label
+        game_log_label = tk.Label(game_log_frame, text="--GAME LOG--", fg = 'lightgray', font=("Helvetica", 15, "bold"))
+        game_log_label.grid(row = 0, column = 0, sticky = 'nsw')
+
+        # Game Log Treeview, newest game first
+        columns = game_log.columns()
+        game_log_table = VirtualTable(game_log_frame, columns = columns, height = VISIBLE_ROWS)
+        game_log_table.config(selectmode = "none")
+        game_log_table.grid(row = 1, column = 0, rowspan = 4, sticky = 'nsew')
+
+        # Add Column Names and Widths to Treeview
+        for col in columns:
+            game_log_table.heading(col, text=col)
+            game_log_table.column(col, width = 120 if col in ("Game Date", "Match Up") else 50)
 
-        header = []
-        table_data = []
-        for row in rows:
-            row_data= []
-            header.append(row.find_element(By.TAG_NAME, 'h3').text)
-            for col in row.find_elements(By.TAG_NAME, 'li'):
-                row_data.append(col.text)
-            table_data.append(row_data)
+        # Add data to Treeview
+        self.sync_table(game_log_table, game_log.rows())
+        self.team_view["game_log_table"] = game_log_table
 
-        return [header] + table_data
+    def Scoring(self, tab, team, player_stats):
+        # Update the GUI again
+        self.root.update_idletasks()
+
+        distribution = team_distribution(team, player_stats)
+
+        # Scoring Distribution Frame
+        scoring_frame = tk.Frame(tab)
+        scoring_frame.place(x = 0, y = 0, relwidth = 0.75, relheight = 1)
+        scoring_frame.columnconfigure((0), weight = 1)
+        scoring_frame.rowconfigure((0, 1, 2, 3, 4), weight = 1)
+
+        # Scoring Distribution Label
+        scoring_label = tk.Label(scoring_frame, text="--SCORING DISTRIBUTION--", fg = 'lightgray', font=("Helvetica", 15, "bold"))
+        scoring_label.grid(row = 0, column = 0, sticky = 'nsw')
+
+        # Scoring Distribution Treeview, top scorers first
+        scoring_table = VirtualTable(scoring_frame, columns = SCORING_COLUMNS, height = VISIBLE_ROWS)
+        scoring_table.config(selectmode = "none")
+        scoring_table.grid(row = 1, column = 0, rowspan = 4, sticky = 'nsew')
+
+        # Add Column Names and Widths to Treeview
+        for col in SCORING_COLUMNS:
+            scoring_table.heading(col, text=col)
+            scoring_table.column(col, width = 140 if col in ("PLAYER", "TIER") else 60)
+
+        # Add data to Treeview
+        self.sync_table(scoring_table, distribution.rows())
+        self.team_view["scoring_table"] = scoring_table
+
+        # Team or League Selector, the league is merged from every team's player stats once per session
+        team_view = self.team_view
+        team_view["scoring_mode"] = "Team"
+        team_view["scoring_stats"] = player_stats
+        mode_box = ttk.Combobox(scoring_frame, values = ["Team", "League"], state = 'readonly', width = 10)
+        mode_box.set("Team")
+        mode_box.grid(row = 0, column = 0, sticky = 'nse')
+
+        def show_team():
+            team_view["scoring_mode"] = "Team"
+            self.sync_table(scoring_table, team_distribution(team, team_view["scoring_stats"]).rows())
+
+        def show_league(league):
+            if mode_box.get() != "League":
+                return
+            if isinstance(league, Exception):
+                mode_box.set("Team")
+                show_team()
+                scoring_label.config(text=f"--SCORING DISTRIBUTION-- could not build the league table: {league}")
+                return
+            self.league_scoring = league
+            team_view["scoring_mode"] = "League"
+            scoring_label.config(text="--LEAGUE SCORING DISTRIBUTION--")
+            self.sync_table(scoring_table, league.rows())
+
+        def mode_select(_):
+            if mode_box.get() == "Team":
+                scoring_label.config(text="--SCORING DISTRIBUTION--")
+                show_team()
+                return
+            if self.league_scoring is not None:
+                show_league(self.league_scoring)
+                return
+            scoring_label.config(text="--SCORING DISTRIBUTION-- building the league table...")
+            results = queue.Queue()
+
+            def build():
+                try:
+                    results.put(self.scoringDistribution())
+                except Exception as error:
+                    results.put(error)
+
+            def poll():
+                try:
+                    show_league(results.get_nowait())
+                except queue.Empty:
+                    self.root.after(50, poll)
+
+            threading.Thread(target=build, daemon=True).start()
+            poll()
+
+        mode_box.bind("<<ComboboxSelected>>", mode_select)
+
+        # Concentration Frame
+        concentration_frame = tk.Frame(tab, bg="#404040")
+        concentration_frame.place(relx = 0.76, y = 0, relwidth = 0.24, relheight = 0.5)
+        concentration_frame.columnconfigure((0, 1), weight = 1)
+        concentration_frame.rowconfigure((0, 1, 2, 3, 4, 5, 6), weight = 1)
+
+        # Concentration Label
+        concentration_label = tk.Label(concentration_frame, text="--CONCENTRATION--", fg = 'lightgray', font=("Helvetica", 15, "bold"))
+        concentration_label.grid(row = 0, column = 0, columnspan = 2, sticky = 'nsw')
+
+        # Concentration
+        scoring_labels = []
+        texts = self.scoring_texts(distribution, team)
+        for i in range(0, len(texts), 2):
+            name = tk.Label(concentration_frame, text=texts[i], bg="#404040", fg="white", font=("Helvetica", 14, "bold"))
+            name.grid(row = i // 2 + 1, column = 0, sticky = "nsw")
+            value = tk.Label(concentration_frame, text=texts[i + 1], bg="#404040", fg="white", font=("Helvetica", 14))
+            value.grid(row = i // 2 + 1, column = 1, sticky = "nsw")
+            scoring_labels.extend([[name, name.cget('text')], [value, value.cget('text')]])
+        self.team_view["scoring_labels"] = scoring_labels
+
+    def getPlayer(self, player, player_stats):
+        # Name index lookup on the parsed StatTable instead of scanning every row
+        return player_stats.row(player)
+
+    def back_to_teams(self):
+        # The home screen is never rebuilt, just raised again
+        self.save_view_state()
+        self.active_selection = None
+        self.current_team = None
+        self.views.show("home")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NBA Team Scoring Distributions")
+    parser.add_argument("--preload", action="store_true", default=os.environ.get("HOOPMETRICS_PRELOAD") == "1",
+                        help="scrape all 30 teams into the cache at startup")
+    parser.add_argument("--refresh", default=os.environ.get("HOOPMETRICS_REFRESH"),
+                        help="refresh every team on a schedule: hourly, nightly or a number of hours")
+    parser.add_argument("--preload-workers", type=int, default=int(os.environ.get("HOOPMETRICS_PRELOAD_WORKERS", 1)),
+                        help="teams scraped at the same time while preloading")
+    parser.add_argument("--live-refresh", type=float, default=os.environ.get("HOOPMETRICS_LIVE_REFRESH"),
+                        help="re-scrape the selected team every N seconds and apply only what changed")
+    parser.add_argument("--stats-url", nargs="?", const=STATS_URL, default=os.environ.get("HOOPMETRICS_STATS_URL"),
+                        help="read the stats tables from the stats JSON endpoints, optionally at another base URL")
+    parser.add_argument("--metrics", default=os.environ.get("HOOPMETRICS_METRICS"),
+                        help="append per-stage timings and WebDriver command counts to this JSON Lines file")
+    parser.add_argument("--service", default=os.environ.get("HOOPMETRICS_SERVICE"),
+                        help="run as a thin client of a hoopService at this URL instead of scraping")
+    parser.add_argument("--debug-overlay", action="store_true", default=os.environ.get("HOOPMETRICS_DEBUG_OVERLAY") == "1",
+                        help="show the latest timings on screen")
+    args = parser.parse_args()
+
     root = tk.Tk()
-    nba_stats = NBAStats(root)
+    nba_stats = NBAStats(root, metrics_path=args.metrics)
+    if args.debug_overlay:
+        nba_stats.show_debug_overlay()
+    nba_stats.live_refresh_seconds = args.live_refresh
+    if args.stats_url:
+        nba_stats.stats_client = StatsClient(args.stats_url)
+    if args.service:
+        nba_stats.service_client = ServiceClient(args.service)
     root.wm_attributes('-fullscreen', True)
-    root.mainloop()
\ No newline at end of file
+
+    # Give preloading its own browser sessions so it never starves team clicks
+    if args.preload or args.refresh:
+        nba_stats.driver_pool.size += nba_stats.scrape_workers * args.preload_workers
+    if args.preload:
+        threading.Thread(target=nba_stats.preloadTeams, args=(args.preload_workers,), daemon=True).start()
+    if args.refresh:
+        nba_stats.schedulePreload(args.refresh, args.preload_workers)
+    root.mainloop()
+    nba_stats.driver_pool.shutdown()
+    nba_stats.metrics.close()
\ No newline at end of file
@@ -0,0 +1,173 @@
+# Team Data Service:
+# One process owns the browser sessions, the cache and the history and serves team data to any
+# number of kiosks over local HTTP. Concurrent requests for the same team share the scrapes of the kinds they have in common.
+#
+#   python hoopService.py --port 8765
+#   python hoopMetrics.py --service http://127.0.0.1:8765
+#
+#   GET /team/<team>?kinds=roster,player_stats   -> {"team": ..., "data": {kind: data}}
+#   GET /history/<team>                          -> {"team": ..., "seasons": [season, ...]}
+#   GET /history/<team>?season=2022-23           -> {"team": ..., "season": ..., "data": {kind: data or null}}
+#   GET /health                                  -> {"status": "ok", ...}
+#   GET /metrics                                 -> per-stage timing summary
+
+import argparse
+import asyncio
+import json
+import sys
+from urllib.parse import parse_qs, urlsplit
+
+from nbaScraper import NBAScraper, TEAM_IDS
+from teamCache import DEFAULT_TTLS
+from statsClient import STATS_URL
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 502: "Bad Gateway"}
+
+
+class TeamService:
+    def __init__(self, scraper, workers=4):
+        self.scraper = scraper
+        self.workers = workers
+        self.semaphore = asyncio.Semaphore(workers)
+
+        # (team, kind) -> future of the scrape that is loading that kind
+        self.in_flight = {}
+        self.requests = 0
+        self.scrapes = 0
+
+    async def team_data(self, team, kinds):
+        # Fresh cache entries are served directly, kinds already being scraped join that scrape,
+        # and everything else is loaded by a single new scrape for this request
+        team_id_num = TEAM_IDS[team]
+        team_data = {}
+        waiting = {}
+        to_scrape = []
+        for kind in kinds:
+            data, fresh = self.scraper.team_cache.get(team_id_num, kind)
+            if fresh:
+                team_data[kind] = data
+            elif (team, kind) in self.in_flight:
+                waiting.setdefault(self.in_flight[team, kind], []).append(kind)
+            else:
+                to_scrape.append(kind)
+
+        if to_scrape:
+            future = asyncio.ensure_future(self.scrape(team, to_scrape))
+            for kind in to_scrape:
+                self.in_flight[team, kind] = future
+            future.add_done_callback(lambda done: self.finished(team, to_scrape, done))
+            waiting[future] = to_scrape
+
+        for future, future_kinds in waiting.items():
+            result = await asyncio.shield(future)
+            team_data.update({kind: result[kind] for kind in future_kinds if kind in result})
+        return team_data
+
+    def finished(self, team, kinds, future):
+        for kind in kinds:
+            if self.in_flight.get((team, kind)) is future:
+                del self.in_flight[team, kind]
+
+    async def scrape(self, team, kinds):
+        async with self.semaphore:
+            self.scrapes += 1
+            return await asyncio.get_running_loop().run_in_executor(None, self.scraper.collectTeam, team, kinds)
+
+    async def handle(self, reader, writer):
+        # Minimal HTTP/1.1 with keep-alive: one JSON response per GET request
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                parts = request_line.decode("latin-1").split()
+                status, body = await self.route(*parts[:2]) if len(parts) >= 2 else (400, {"error": "bad request"})
+                payload = json.dumps(body).encode("utf-8")
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(payload)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def route(self, method, target):
+        if method != "GET":
+            return 405, {"error": "only GET is supported"}
+        url = urlsplit(target)
+        path = [part for part in url.path.split("/") if part]
+        if path == ["health"]:
+            return 200, {"status": "ok", "requests": self.requests, "scrapes": self.scrapes, "in_flight": sorted({f"{team}/{kind}" for team, kind in self.in_flight})}
+        if path == ["metrics"]:
+            return 200, self.scraper.metrics.summary()
+        if len(path) == 2 and path[0] == "history":
+            team = path[1].lower()
+            if team not in TEAM_IDS:
+                return 404, {"error": f"unknown team {team}"}
+            query = parse_qs(url.query)
+            if "season" not in query:
+                return 200, {"team": team, "seasons": self.scraper.historySeasons(team)}
+            season = query["season"][0]
+            kinds = query.get("kinds", ["player_stats,overall_stats"])[0].split(",")
+            return 200, {"team": team, "season": season, "data": self.scraper.historySnapshot(team, season, kinds)}
+        if len(path) == 2 and path[0] == "team":
+            team = path[1].lower()
+            if team not in TEAM_IDS:
+                return 404, {"error": f"unknown team {team}"}
+            kinds = parse_qs(url.query).get("kinds", [",".join(DEFAULT_TTLS)])[0].split(",")
+            unknown = [kind for kind in kinds if kind not in DEFAULT_TTLS]
+            if unknown:
+                return 400, {"error": f"unknown kinds {', '.join(unknown)}"}
+            self.requests += 1
+            try:
+                return 200, {"team": team, "data": await self.team_data(team, kinds)}
+            except Exception as error:
+                return 502, {"error": f"could not load {team}: {error}"}
+        return 404, {"error": "not found"}
+
+
+async def serve(host, port, scraper, workers):
+    service = TeamService(scraper, workers)
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f"Serving team data on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve NBA team data to many kiosks from one scraper")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=4, help="teams scraped at the same time")
+    parser.add_argument("--stats-url", nargs="?", const=STATS_URL, help="read the stats tables from the stats JSON endpoints")
+    parser.add_argument("--metrics", help="append per-stage timings to this JSON Lines file")
+    parser.add_argument("--refresh", help="refresh every team on a schedule: hourly, nightly or a number of hours")
+    args = parser.parse_args(argv)
+
+    scraper = NBAScraper(stats_url=args.stats_url, metrics_path=args.metrics)
+    scraper.driver_pool.size = scraper.scrape_workers * (args.workers + (1 if args.refresh else 0))
+    if args.refresh:
+        scraper.schedulePreload(args.refresh)
+    try:
+        asyncio.run(serve(args.host, args.port, scraper, args.workers))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scraper.driver_pool.shutdown()
+        scraper.metrics.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
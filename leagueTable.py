@@ -0,0 +1,96 @@
+# League Table:
+# Merge every team's stats table into one league-wide table once, and precompute the rank and
+# percentile of every row in every numeric column, so comparing any players (or teams) across
+# the league is a dictionary lookup instead of a scrape.
+
+from array import array
+
+from statTable import StatTable, normalize_name
+
+# Columns where a smaller value ranks higher
+LOWER_IS_BETTER = {"TOV", "PF"}
+
+
+class LeagueTable:
+    def __init__(self, team_tables, name_column="PLAYER"):
+        # team_tables maps a team name to a [header] + rows table whose first column names the row
+        header = None
+        rows = []
+        for team, table in team_tables.items():
+            if not table:
+                continue
+            if header is None:
+                header = [name_column, "TEAM"] + list(table[0][1:])
+            positions = {column: i for i, column in enumerate(table[0])}
+            for row in table[1:]:
+                rows.append([row[0], team] + [row[positions[column]] if positions.get(column, len(row)) < len(row) else ""
+                                              for column in header[2:]])
+        self.table = StatTable([header or [name_column, "TEAM"]] + rows)
+        self.header = self.table.header
+
+        # Rank 1 is the league's best value; ties share the better rank
+        self.ranks = {}
+        self.percentiles = {}
+        count = len(self.table)
+        for column, values, numeric in zip(self.header, self.table.columns, self.table.numeric):
+            if not numeric:
+                continue
+            ascending = column in LOWER_IS_BETTER
+            order = sorted(range(count), key=values.__getitem__, reverse=not ascending)
+            ranks = array("i", [0] * count)
+            for position, row_num in enumerate(order):
+                previous = order[position - 1] if position else None
+                ranks[row_num] = ranks[previous] if previous is not None and values[previous] == values[row_num] else position + 1
+            self.ranks[column] = ranks
+            self.percentiles[column] = array("d", (100.0 * (count - rank) / (count - 1) if count > 1 else 100.0 for rank in ranks))
+
+    @classmethod
+    def from_team_stats(cls, overall_tables):
+        # One row per team from the first (season overall) row of each getOverallStats table
+        return cls({team: [table[0], [team] + list(table[1][1:])] for team, table in overall_tables.items() if len(table) > 1},
+                   name_column="NAME")
+
+    def alias(self, name, alias):
+        # Let another name for a row, like a team's display name, find it too
+        row_num = self.find(name)
+        if row_num is not None:
+            self.table.index.setdefault(normalize_name(alias), row_num)
+
+    def __len__(self):
+        return len(self.table)
+
+    def find(self, name):
+        return self.table.find(name)
+
+    def stats(self, name):
+        # {column: (value, rank, percentile)} for every numeric column, or None for unknown names
+        row_num = self.find(name)
+        if row_num is None:
+            return None
+        return {column: (self.table.columns[i][row_num], self.ranks[column][row_num], self.percentiles[column][row_num])
+                for i, column in enumerate(self.header) if column in self.ranks}
+
+    def compare(self, names):
+        # Side by side league standing of any number of players or teams
+        return {name: self.stats(name) for name in names}
+
+    def comparison_rows(self, names, columns=None):
+        # Display rows: one per stat, each name's value with its league percentile
+        found = [(name, self.find(name)) for name in names]
+        found = [(name, row_num) for name, row_num in found if row_num is not None]
+        rows = [["TEAM"] + [self.table.columns[1][row_num] for _, row_num in found]]
+        for i, column in enumerate(self.header):
+            if column not in self.ranks or (columns and column not in columns):
+                continue
+            rows.append([column] + [f"{self.table.rows[row_num][i]} ({self.percentiles[column][row_num]:.0f}%)" for _, row_num in found])
+        return [["STAT"] + [self.table.rows[row_num][0] for _, row_num in found]] + rows
+
+    def leaders(self, column, count=10):
+        ranks = self.ranks[column]
+        order = sorted(range(len(self.table)), key=ranks.__getitem__)[:count]
+        return [self.table.rows[row_num] for row_num in order]
+
+    def matches(self, text, limit=10):
+        # Names starting with the typed text, for pickers
+        key = normalize_name(text)
+        return [self.table.rows[row_num][0] for name, row_num in self.table.index.items() if name.startswith(key)][:limit]
@@ -0,0 +1,84 @@
+# Metrics:
+# Time each scrape and render stage and count WebDriver commands, keeping per-stage summaries in
+# memory and optionally appending every measurement to a JSON Lines file for comparing releases.
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+def percentile(values, fraction):
+    # Nearest-rank percentile of a sorted list
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+class Metrics:
+    def __init__(self, path=None, window=1000):
+        # Percentiles cover each stage's latest `window` samples so a long-running kiosk stays bounded;
+        # counts and totals cover every sample
+        self.path = path
+        self.window = window
+        self.timings = {}
+        self.totals = {}
+        self.counters = {}
+        self.recent = []
+        self.lock = threading.Lock()
+        self.file = open(path, "a", encoding="utf-8") if path else None
+
+    def record(self, stage, seconds, **labels):
+        with self.lock:
+            self.timings.setdefault(stage, deque(maxlen=self.window)).append(seconds)
+            count, total = self.totals.get(stage, (0, 0.0))
+            self.totals[stage] = (count + 1, total + seconds)
+            self.recent = (self.recent + [(stage, seconds, labels)])[-10:]
+            if self.file:
+                self.file.write(json.dumps({"at": time.time(), "stage": stage, "seconds": round(seconds, 6), **labels}) + "\n")
+                self.file.flush()
+
+    @contextmanager
+    def timer(self, stage, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, **labels)
+
+    def count(self, name, amount=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def counting(self, prefix, function):
+        # Wrap a function so every call is counted under prefix.<first argument>
+        def counted(name, *args, **kwargs):
+            self.count(f"{prefix}.{name}")
+            return function(name, *args, **kwargs)
+        return counted
+
+    def summary(self):
+        # {stage: {"count", "total", "mean", "p50", "p95", "max"}} plus the counters;
+        # count, total and mean cover every sample, the percentiles and max the recent window
+        with self.lock:
+            timings = {stage: sorted(values) for stage, values in self.timings.items()}
+            totals = dict(self.totals)
+            counters = dict(self.counters)
+        stages = {stage: {"count": totals[stage][0], "total": totals[stage][1], "mean": totals[stage][1] / totals[stage][0],
+                          "p50": percentile(values, 0.5), "p95": percentile(values, 0.95), "max": values[-1]}
+                  for stage, values in timings.items()}
+        return {"stages": stages, "counters": counters}
+
+    def write_summary(self):
+        if self.file:
+            summary = self.summary()
+            with self.lock:
+                self.file.write(json.dumps({"at": time.time(), "stage": "summary", **summary}) + "\n")
+                self.file.flush()
+
+    def close(self):
+        self.write_summary()
+        if self.file:
+            self.file.close()
+            self.file = None
@@ -0,0 +1,557 @@
+# NBA Scraper:
+# Scrape team rosters, stats and franchise history from nba.com without any GUI imports,
+# so the same scrapers back the Tk app, the command-line exporter and background preloading.
+
+import time
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from pageSnapshot import PageSnapshot, By
+from teamCache import TeamCache, DEFAULT_TTLS
+from driverPool import DriverPool
+from historyStore import HistoryStore, current_season
+from gameLog import GameLogStore
+from scoringDistribution import league_distribution
+from leagueTable import LeagueTable
+from circuitBreaker import HostBreakers
+from statsClient import StatsClient
+from metrics import Metrics
+from serviceClient import ServiceClient
+
+# NBA team ids used in nba.com team and stats page URLs
+TEAM_IDS = {"hawks": 1610612737, "celtics": 1610612738, "cavaliers": 1610612739, "pelicans": 1610612740, "bulls": 1610612741, "mavericks": 1610612742
+            , "nuggets": 1610612743, "warriors": 1610612744, "rockets": 1610612745, "clippers": 1610612746, "lakers": 1610612747, "heat": 1610612748
+            , "bucks": 1610612749, "timberwolves": 1610612750, "nets": 1610612751, "knicks": 1610612752, "magic": 1610612753, "pacers": 1610612754
+            , "76ers": 1610612755, "suns": 1610612756, "blazers": 1610612757, "kings": 1610612758, "spurs": 1610612759, "thunder": 1610612760
+            , "raptors": 1610612761, "jazz": 1610612762, "grizzlies": 1610612763, "wizards": 1610612764, "pistons": 1610612765, "hornets": 1610612766}
+
+# The element each kind of data waits for before its page is read
+WAIT_SELECTORS = {
+    "roster": (By.TAG_NAME, "table"),
+    "franchise": (By.CLASS_NAME, "TeamRecords_table__0iapO"),
+    "player_stats": (By.CLASS_NAME, "Crom_table__p1iZz"),
+    "overall_stats": (By.CLASS_NAME, "Crom_table__p1iZz"),
+    "game_log": (By.CLASS_NAME, "Crom_table__p1iZz"),
+}
+
+class NBAScraper:
+    def __init__(self, scrape_workers=3, page_timeout=30, extraction_mode="source", cache_directory="team_cache", history_path="hoop_history.db",
+                 wait_timeout=10, retries=2, retry_backoff=0.5, stats_url=None, metrics_path=None, service_url=None):
+        # "source" parses driver.page_source offline, "live" queries the browser element by element
+        self.extraction_mode = extraction_mode
+        self.metrics = Metrics(metrics_path)
+        self.loaded_pages = {}
+        self.page_snapshots = {}
+        self.team_cache = TeamCache(cache_directory)
+
+        # Every scraped stats table is also appended to the multi-season history
+        self.history = HistoryStore(history_path)
+        self.game_logs = GameLogStore(history_path)
+
+        # League-wide player and team tables, merged once and reused for every comparison
+        self.league_tables = None
+        self.league_lock = threading.Lock()
+
+        # Pages scraped at the same time and the seconds each page may take
+        self.scrape_workers = scrape_workers
+        self.page_timeout = page_timeout
+
+        # Seconds to wait for a page's data to render, extra attempts per page and the first retry delay
+        self.wait_timeout = wait_timeout
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+
+        # Hosts that keep failing are skipped for a while and cached data is shown instead
+        self.breakers = HostBreakers()
+
+        # With a stats URL the stats tables come from the JSON endpoints instead of rendered pages
+        self.stats_client = StatsClient(stats_url) if stats_url else None
+
+        # With a service URL every scrape is delegated to a shared hoopService process
+        self.service_client = ServiceClient(service_url) if service_url else None
+
+        # Headless browser sessions are shared across scrapes
+        self.driver_pool = DriverPool(size=self.scrape_workers + 1, page_load_timeout=self.page_timeout, metrics=self.metrics)
+
+    def getTeamPage(self, team_name):
+        return TEAM_IDS.get(team_name)
+    
+    def loadPage(self, driver, team_page_str):
+        # Reuse the parsed snapshot if this driver already pulled the page during the scrape
+        snapshots = self.page_snapshots.setdefault(driver, {})
+        if self.extraction_mode == "source" and team_page_str in snapshots:
+            return snapshots[team_page_str]
+
+        # Only render the page if the driver is not already showing it
+        if self.loaded_pages.get(driver) != team_page_str:
+            with self.metrics.timer("driver.get", url=team_page_str):
+                driver.get(team_page_str)
+            self.loaded_pages[driver] = team_page_str
+        if self.extraction_mode == "live":
+            return driver
+
+        # Pull the page source once and parse every table in-process
+        with self.metrics.timer("page.parse", url=team_page_str):
+            snapshots[team_page_str] = PageSnapshot(driver.page_source, team_page_str)
+        return snapshots[team_page_str]
+
+    def extract(self, extractor, driver, page_str):
+        # Every get* extractor is timed under its own name, including the sections of the team page
+        with self.metrics.timer(f"extract.{extractor.__name__}", url=page_str):
+            return extractor(driver, page_str)
+
+    def getAbout(self, driver, team_page_str):
+        return {
+            "roster": self.extract(self.getRoster, driver, team_page_str),
+            "coaching": self.extract(self.getCoachingStaff, driver, team_page_str),
+            "updates": self.extract(self.getTeamUpdates, driver, team_page_str)
+        }
+
+    def getFranchise(self, driver, team_page_str):
+        return {
+            "retired_numbers": self.extract(self.getRetiredNumbers, driver, team_page_str),
+            "hall_of_fame": self.extract(self.getHallOfFame, driver, team_page_str),
+            "all_time": self.extract(self.getAllTime, driver, team_page_str),
+            "achievements": self.extract(self.getAchievements, driver, team_page_str)
+        }
+
+    def getRecord(self, driver, team_page_str):
+        page = self.loadPage(driver, team_page_str)
+        record_name = page.find_element(By.CLASS_NAME, "TeamHeader_record__wzofp")
+        all_stats_2D = page.find_elements(By.CLASS_NAME, "TeamHeader_rank__lMnzF")
+        
+        stat_line = ""
+        for stat_element in all_stats_2D:
+            stat_text_array = stat_element.text.split("\n")
+            stat_line += stat_text_array[2] + " " + stat_text_array[0] + " ~ " + stat_text_array[1]
+            
+            if stat_element != all_stats_2D[-1]:
+                stat_line += "  |  "
+
+        return [record_name.text, stat_line]
+    
+    def getRoster(self, driver, team_page_str):
+        page = self.loadPage(driver, team_page_str)
+        table = page.find_element(By.TAG_NAME, 'table')
+
+        header = []
+        for row in table.find_elements(By.TAG_NAME, 'th'):
+            header.append(row.text)
+ 
+        table_data = []
+        for row in table.find_elements(By.TAG_NAME, 'tr'):
+            row_data = []
+            for col in row.find_elements(By.TAG_NAME, 'td'):
+                row_data.append(col.text)
+            table_data.append(row_data)
+
+        return [header] + table_data[1:]
+    
+    def getCoachingStaff(self, driver, team_page_str):
+        page = self.loadPage(driver, team_page_str)
+        container = page.find_element(By.CLASS_NAME, "TeamProfile_sectionCoaches__e66bL")
+
+        header = []
+        for each in container.find_elements(By.TAG_NAME, 'h3'):
+            header.append(each.text)
+
+        coaching_data = []
+        for row in container.find_elements(By.TAG_NAME, 'ul'):
+            row_data = []
+            for col in row.find_elements(By.TAG_NAME, 'li'):
+                row_data.append(col.text)
+            coaching_data.append(row_data)
+
+        return [header] + coaching_data
+    
+    def getTeamUpdates(self, driver, team_page_str):
+        page = self.loadPage(driver, team_page_str)
+
+        updates = []
+
+        dates = page.find_elements(By.CLASS_NAME, 'TeamFantasyNews_articleDate__SrBm7')
+        headlines = page.find_elements(By.CLASS_NAME, 'TeamFantasyNews_articleHeadline__02sbs')
+        contents = page.find_elements(By.CLASS_NAME, 'TeamFantasyNews_articleContent__x7vps')
+
+        for date, headline, content in zip(dates, headlines, contents):
+            update = {
+                'date': date.text,
+                'headline': headline.text,
+                'content': content.text
+            }
+            updates.append(update)
+
+        return updates
+    def getPlayerStats(self, driver, team_page_str):
+        page = self.loadPage(driver, team_page_str)
+        table = page.find_elements(By.CLASS_NAME, 'Crom_table__p1iZz')[-1]
+
+        header = []
+        for row in table.find_elements(By.TAG_NAME, 'th'):
+            header.append(row.text)
+
+        table_data = []
+        for row in table.find_elements(By.TAG_NAME, 'tr'):
+            row_data = []
+            for col in row.find_elements(By.TAG_NAME, 'td'):
+                row_data.append(col.text)
+            table_data.append(row_data)
+
+        return [header] + table_data[1:]
+    
+    def getOverallStats(self, driver, team_page_str):
+        page = self.loadPage(driver, team_page_str)
+        tables = page.find_elements(By.CLASS_NAME, 'Crom_table__p1iZz')[:3]
+
+        header = []
+        for row in tables[0].find_elements(By.TAG_NAME, 'th'):
+            header.append(row.text)
+        header[0] = ""
+        all_data = []
+        for table in tables:
+            for row in table.find_elements(By.TAG_NAME, 'tr')[1:]:
+                row_data = []
+                
+                for col in row.find_elements(By.TAG_NAME, 'td'):
+                    row_data.append(col.text)
+                
+                all_data.append(row_data)
+        
+        return [header] + all_data
+    
+    def getGameLog(self, driver, team_page_str):
+        page = self.loadPage(driver, team_page_str)
+        table = page.find_elements(By.CLASS_NAME, 'Crom_table__p1iZz')[-1]
+
+        header = []
+        for row in table.find_elements(By.TAG_NAME, 'th'):
+            header.append(row.text)
+
+        table_data = []
+        for row in table.find_elements(By.TAG_NAME, 'tr')[1:]:
+            table_data.append([col.text for col in row.find_elements(By.TAG_NAME, 'td')])
+
+        return [header] + table_data
+
+    def getRetiredNumbers(self, driver, team_page_str):
+        page = self.loadPage(driver, team_page_str)
+        table = page.find_element(By.CLASS_NAME, 'TeamRetired_content__nb7Qt')
+
+        header = []
+        for row in table.find_elements(By.TAG_NAME, 'th'):
+            header.append(row.text)
+        table_data = []
+        for row in table.find_elements(By.TAG_NAME, 'tr'):
+            row_data = []
+            for col in row.find_elements(By.TAG_NAME, 'td'):
+                row_data.append(col.text)
+            table_data.append(row_data)
+
+        return [header] + table_data[1:]
+    
+    def getHallOfFame(self, driver, team_page_str):
+        page = self.loadPage(driver, team_page_str)
+        table = page.find_element(By.CLASS_NAME, 'TeamHallOfFame_content__IZSl2')
+
+        header = []
+        for row in table.find_elements(By.TAG_NAME, 'th'):
+            header.append(row.text)
+        table_data = []
+        for row in table.find_elements(By.TAG_NAME, 'tr'):
+            row_data = []
+            for col in row.find_elements(By.TAG_NAME, 'td'):
+                row_data.append(col.text)
+            table_data.append(row_data)
+
+        return [header] + table_data[1:]
+    
+    def getAllTime(self, driver, team_page_str):
+        page = self.loadPage(driver, team_page_str)
+        table = page.find_element(By.CLASS_NAME, 'TeamRecords_table__0iapO')
+
+        table_data = []
+        for row in table.find_elements(By.TAG_NAME, 'tr'):
+            row_data = []
+            for col in row.find_elements(By.TAG_NAME, 'td'):
+                row_data.append(col.text)
+            table_data.append(row_data)
+
+        return table_data
+    
+    def getAchievements(self, driver, team_page_str):
+        page = self.loadPage(driver, team_page_str)
+        rows = page.find_elements(By.CLASS_NAME, 'TeamAwards_group__XU0o9')
+
+        header = []
+        table_data = []
+        for row in rows:
+            row_data= []
+            header.append(row.find_element(By.TAG_NAME, 'h3').text)
+            for col in row.find_elements(By.TAG_NAME, 'li'):
+                row_data.append(col.text)
+            table_data.append(row_data)
+
+        return [header] + table_data
+
+    def teamPages(self, team, season=None):
+        # The page each kind of data is read from and the extractor that reads it
+        team_id_num = self.getTeamPage(team.lower())
+        team_page = f'https://www.nba.com/team/{team_id_num}/{team.lower()}'
+        season_query = f'?Season={season}' if season else ''
+        return {
+            "roster": (team_page, self.getAbout),
+            "franchise": (team_page, self.getFranchise),
+            "player_stats": (f'https://www.nba.com/stats/team/{team_id_num}/players-traditional{season_query}', self.getPlayerStats),
+            "overall_stats": (f'https://www.nba.com/stats/team/{team_id_num}/traditional{season_query}', self.getOverallStats),
+            "game_log": (f'https://www.nba.com/stats/team/{team_id_num}/boxscores-traditional{season_query}', self.getGameLog)
+        }
+
+    def scrapeTeam(self, team, kinds=DEFAULT_TTLS, page_scraped=None, season=None):
+        if self.service_client:
+            return self.requestTeam(team, kinds, page_scraped)
+
+        # Group the extractors by page so every distinct page is loaded once, by one worker
+        page_jobs = {}
+        json_kinds = []
+        for kind, (page_str, extractor) in self.teamPages(team, season).items():
+            if kind not in kinds:
+                continue
+            if self.stats_client and kind in ("player_stats", "overall_stats"):
+                json_kinds.append(kind)
+            else:
+                page_jobs.setdefault(page_str, []).append((kind, extractor))
+
+        # The pages do not depend on each other, so load them at the same time on separate drivers
+        executor = ThreadPoolExecutor(max_workers=self.scrape_workers)
+        futures = [executor.submit(self.scrapePage, page_str, jobs) for page_str, jobs in page_jobs.items()]
+        futures += [executor.submit(self.fetchStats, team, kind, season) for kind in json_kinds]
+
+        # Pages queue behind each other once every worker is busy, so allow one page budget per round
+        rounds = -(-len(futures) // self.scrape_workers)
+        team_data = {}
+        errors = []
+        start = time.perf_counter()
+        try:
+            for future in as_completed(futures, timeout=self.pageBudget() * rounds):
+                # A failed page does not hold back the pages that did load
+                try:
+                    page_data = future.result()
+                except Exception as error:
+                    errors.append(error)
+                    continue
+                team_data.update(page_data)
+                # A locked or unreadable history store must not cost the page its delivery
+                try:
+                    self.recordHistory(team, page_data, season)
+                except Exception as error:
+                    self.metrics.count("history.failure")
+                    print(f"Recording history for {team} failed: {error}")
+                if page_scraped:
+                    page_scraped(page_data)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.metrics.record("scrape.team", time.perf_counter() - start, team=team, kinds=sorted(kinds), failed=len(errors))
+        if errors:
+            raise errors[0]
+        return team_data
+
+    def pageBudget(self):
+        # Longest one page can take: waiting for a driver, then every attempt's load and wait and the backoff between them
+        backoff = self.retry_backoff * (2 ** self.retries - 1)
+        return self.page_timeout + (self.retries + 1) * (self.page_timeout + self.wait_timeout) + backoff
+
+    def fetchPage(self, driver, page_str, selectors):
+        # Load the page and wait until the elements the extractors read are present, retrying with backoff;
+        # selenium is only imported once the first page is actually scraped
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import WebDriverException
+
+        breaker = self.breakers.check(page_str)
+        for attempt in range(self.retries + 1):
+            try:
+                with self.metrics.timer("driver.get", url=page_str, attempt=attempt):
+                    driver.get(page_str)
+                self.loaded_pages[driver] = page_str
+                with self.metrics.timer("page.wait", url=page_str):
+                    WebDriverWait(driver, self.wait_timeout).until(EC.all_of(*(EC.presence_of_element_located(selector) for selector in selectors)))
+                breaker.success()
+                return
+            except WebDriverException:
+                self.loaded_pages.pop(driver, None)
+                # The breaker counts pages that failed, not attempts, so one flaky page cannot open it
+                if attempt == self.retries:
+                    breaker.failure()
+                    self.metrics.count("page.failure")
+                    raise
+                self.metrics.count("page.retry")
+                time.sleep(self.retry_backoff * 2 ** attempt)
+            except Exception:
+                # Anything else (a dead chromedriver's connection error) fails the page at once and
+                # still settles a half-open trial, so the breaker cannot stay stuck refusing the host
+                self.loaded_pages.pop(driver, None)
+                breaker.failure()
+                self.metrics.count("page.failure")
+                raise
+
+    def requestTeam(self, team, kinds, page_scraped=None):
+        # Thin client mode: one request per page so each tab still fills in as soon as its data arrives;
+        # the service records the history and serves it back through historySeasons and historySnapshot
+        page_kinds = {}
+        for kind, (page_str, _) in self.teamPages(team).items():
+            if kind in kinds:
+                page_kinds.setdefault(page_str, []).append(kind)
+        team_data = {}
+        with ThreadPoolExecutor(max_workers=len(page_kinds) or 1) as executor:
+            futures = [executor.submit(self.service_client.team, team, page) for page in page_kinds.values()]
+            with self.metrics.timer("service.team", team=team):
+                for future in as_completed(futures):
+                    page_data = future.result()
+                    team_data.update(page_data)
+                    if page_scraped:
+                        page_scraped(page_data)
+        return team_data
+
+    def scrapePage(self, page_str, jobs):
+        with self.driver_pool.session(timeout=self.page_timeout) as driver:
+            # Each driver renders its page once and shares it with every extractor in the job
+            self.loaded_pages.pop(driver, None)
+            self.page_snapshots[driver] = {}
+            try:
+                self.fetchPage(driver, page_str, {WAIT_SELECTORS[kind] for kind, _ in jobs if kind in WAIT_SELECTORS})
+                page_data = {}
+                for kind, extractor in jobs:
+                    page_data[kind] = self.extract(extractor, driver, page_str)
+                return page_data
+            finally:
+                self.loaded_pages.pop(driver, None)
+                self.page_snapshots.pop(driver, None)
+
+    def fetchStats(self, team, kind, season=None):
+        # One JSON request in place of rendering a stats page in Chrome
+        breaker = self.breakers.check(self.stats_client.base_url)
+        extractor = getattr(self.stats_client, {"player_stats": "getPlayerStats", "overall_stats": "getOverallStats"}[kind])
+        try:
+            with self.metrics.timer(f"stats.{extractor.__name__}", team=team):
+                data = extractor(self.getTeamPage(team.lower()), season or current_season())
+        except Exception:
+            breaker.failure()
+            raise
+        breaker.success()
+        return {kind: data}
+
+    def preloadTeams(self, workers=1):
+        # Scrape every team whose cached data has expired so clicks are served from the cache
+        def preload(team):
+            _, stale = self.team_cache.load_team(TEAM_IDS[team])
+            if stale:
+                self.refreshTeam(team, stale)
+
+        # Each team already scrapes its pages in parallel, so only a few teams run at once
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(preload, TEAM_IDS))
+        print("Preloaded all teams")
+
+    def schedulePreload(self, schedule, workers=1):
+        # "hourly" runs at the top of every hour, "nightly" at 4am, a number means every N hours
+        def next_run():
+            now = datetime.now()
+            if schedule == "hourly":
+                return now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+            if schedule == "nightly":
+                run_at = now.replace(hour=4, minute=0, second=0, microsecond=0)
+                return run_at if run_at > now else run_at + timedelta(days=1)
+            return now + timedelta(hours=float(schedule))
+
+        def run():
+            while not self.driver_pool.closed:
+                time.sleep(max(0, (next_run() - datetime.now()).total_seconds()))
+                self.preloadTeams(workers)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def refreshTeam(self, team, kinds):
+        team_id_num = self.getTeamPage(team.lower())
+        try:
+            for kind, data in self.scrapeTeam(team, kinds).items():
+                self.team_cache.put(team_id_num, kind, data)
+        except Exception as error:
+            print(f"Background refresh of {team} failed: {error}")
+
+    def recordHistory(self, team, page_data, season=None):
+        team_id_num = self.getTeamPage(team.lower())
+        for kind in ("player_stats", "overall_stats"):
+            if kind in page_data:
+                self.history.append(team_id_num, season or current_season(), kind, page_data[kind])
+        if "game_log" in page_data:
+            self.game_logs.ingest(team_id_num, season or current_season(), page_data["game_log"])
+
+    def historySeasons(self, team, kind="player_stats"):
+        # Seasons with recorded stats, newest first, from the service's store in thin client mode
+        if self.service_client:
+            return self.service_client.seasons(team)
+        return self.history.seasons(self.getTeamPage(team.lower()), kind)
+
+    def historySnapshot(self, team, season, kinds=("player_stats", "overall_stats")):
+        # {kind: latest recorded [header] + rows for the season, or None}
+        if self.service_client:
+            return self.service_client.history(team, season, kinds)
+        team_id_num = self.getTeamPage(team.lower())
+        return {kind: self.history.latest(team_id_num, season, kind) for kind in kinds}
+
+    def backfillSeasons(self, team, seasons):
+        # Scrape past seasons' stats pages and game logs straight into the history store
+        for season in seasons:
+            self.scrapeTeam(team, ("player_stats", "overall_stats", "game_log"), season=season)
+
+    def leagueData(self, kinds, teams=TEAM_IDS, use_cache=True, workers=1):
+        # Every team's data for the given kinds in one pass, from the cache where it is still fresh
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {team: executor.submit(self.collectTeam, team, kinds, use_cache) for team in teams}
+        return {team: future.result() for team, future in futures.items()}
+
+    def leaguePlayerStats(self, teams=TEAM_IDS, use_cache=True, workers=1):
+        return {team: data["player_stats"] for team, data in self.leagueData(("player_stats",), teams, use_cache, workers).items()}
+
+    def leagueTables(self, teams=TEAM_IDS, use_cache=True, workers=1, rebuild=False):
+        # {"players": LeagueTable, "teams": LeagueTable} with league ranks and percentiles, built once per session
+        with self.league_lock:
+            if rebuild or self.league_tables is None:
+                league_data = self.leagueData(("player_stats", "overall_stats"), teams, use_cache, workers)
+                self.league_tables = {
+                    "players": LeagueTable({team: data["player_stats"] for team, data in league_data.items()}),
+                    "teams": LeagueTable.from_team_stats({team: data["overall_stats"] for team, data in league_data.items()})
+                }
+            return self.league_tables
+
+    def scoringDistribution(self, teams=TEAM_IDS, use_cache=True, workers=1):
+        return league_distribution(self.leaguePlayerStats(teams, use_cache, workers))
+
+    def collectTeam(self, team, kinds=DEFAULT_TTLS, use_cache=True):
+        # Serve kinds that are still fresh in the cache and scrape (and cache) the rest
+        team_id_num = self.getTeamPage(team.lower())
+        team_data = {}
+        to_scrape = list(kinds)
+        if use_cache:
+            for kind in kinds:
+                data, fresh = self.team_cache.get(team_id_num, kind)
+                if fresh:
+                    team_data[kind] = data
+                    to_scrape.remove(kind)
+        if to_scrape:
+            def page_scraped(page_data):
+                for kind, data in page_data.items():
+                    self.team_cache.put(team_id_num, kind, data)
+                    team_data[kind] = data
+
+            try:
+                self.scrapeTeam(team, to_scrape, page_scraped)
+            except Exception as error:
+                # Fall back to expired cache entries for the pages that could not be scraped
+                fallback = {kind: self.team_cache.get(team_id_num, kind)[0] for kind in to_scrape if kind not in team_data}
+                if any(data is None for data in fallback.values()):
+                    raise
+                print(f"Using cached data for {team}: {error}")
+                team_data.update(fallback)
+        return team_data
@@ -0,0 +1,155 @@
+# Page Snapshots:
+# Parse a rendered page's HTML once, in-process, and answer the same find_element(s)/.text
+# lookups the scrapers make against WebDriver, without a browser round-trip per element.
+
+import re
+from html.parser import HTMLParser
+
+# Selenium locator strategies (the values of By.CLASS_NAME / By.TAG_NAME)
+CLASS_NAME = "class name"
+TAG_NAME = "tag name"
+
+
+class By:
+    # Same values as selenium's By, so locators work against WebDriver without importing selenium
+    CLASS_NAME = CLASS_NAME
+    TAG_NAME = TAG_NAME
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"}
+HIDDEN_TAGS = {"head", "script", "style", "noscript", "template", "svg"}
+BLOCK_TAGS = {"address", "article", "aside", "blockquote", "caption", "dd", "div", "dl", "dt", "figcaption", "figure", "footer",
+              "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section",
+              "table", "tbody", "tfoot", "thead", "tr", "ul"}
+CELL_TAGS = {"td", "th"}
+
+# Tags that close an open sibling of the same kind when the closing tag was left out
+IMPLICIT_CLOSE = {"li": {"li"}, "p": {"p"}, "td": {"td", "th"}, "th": {"td", "th"}, "tr": {"tr", "td", "th"},
+                  "dt": {"dt", "dd"}, "dd": {"dt", "dd"}, "option": {"option"}}
+
+BLOCK_BREAK = "\x00"
+CELL_BREAK = "\x01"
+WHITESPACE = re.compile(r"\s+")
+
+
+class NoSuchElementException(Exception):
+    pass
+
+
+class SnapshotElement:
+    def __init__(self, tag, attrs, parent=None):
+        self.tag_name = tag
+        self.attrs = dict(attrs)
+        self.classes = set((self.attrs.get("class") or "").split())
+        self.parent = parent
+        self.children = []
+        self._text = None
+
+    def get_attribute(self, name):
+        return self.attrs.get(name)
+
+    def iter_descendants(self):
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, SnapshotElement):
+                yield node
+                stack.extend(reversed(node.children))
+
+    def find_elements(self, by, value):
+        if by == CLASS_NAME:
+            return [element for element in self.iter_descendants() if value in element.classes]
+        if by == TAG_NAME:
+            value = value.lower()
+            return [element for element in self.iter_descendants() if element.tag_name == value]
+        raise ValueError(f"Unsupported locator strategy: {by}")
+
+    def find_element(self, by, value):
+        if by == CLASS_NAME:
+            matches = (element for element in self.iter_descendants() if value in element.classes)
+        else:
+            matches = iter(self.find_elements(by, value))
+        element = next(matches, None)
+        if element is None:
+            raise NoSuchElementException(f"No element matching {by}={value!r}")
+        return element
+
+    @property
+    def text(self):
+        # Approximate WebDriver's rendered text: blocks start new lines, cells are space separated
+        if self._text is None:
+            parts = []
+            self._collect_text(parts)
+            lines = []
+            for line in "".join(parts).split(BLOCK_BREAK):
+                line = " ".join(cell.strip() for cell in line.split(CELL_BREAK) if cell.strip())
+                if line:
+                    lines.append(line)
+            self._text = "\n".join(lines)
+        return self._text
+
+    def _collect_text(self, parts):
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(WHITESPACE.sub(" ", child))
+            elif child.tag_name == "br":
+                parts.append(BLOCK_BREAK)
+            elif child.tag_name not in HIDDEN_TAGS:
+                separator = BLOCK_BREAK if child.tag_name in BLOCK_TAGS else CELL_BREAK if child.tag_name in CELL_TAGS else ""
+                parts.append(separator)
+                child._collect_text(parts)
+                parts.append(separator)
+
+
+class _SnapshotBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.document = SnapshotElement("#document", [])
+        self.stack = [self.document]
+
+    def handle_starttag(self, tag, attrs):
+        closes = IMPLICIT_CLOSE.get(tag)
+        if closes and self.stack[-1].tag_name in closes:
+            self.stack.pop()
+            if tag == "tr" and self.stack[-1].tag_name == "tr":
+                self.stack.pop()
+        element = SnapshotElement(tag, attrs, self.stack[-1])
+        self.stack[-1].children.append(element)
+        if tag not in VOID_TAGS:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        element = SnapshotElement(tag, attrs, self.stack[-1])
+        self.stack[-1].children.append(element)
+
+    def handle_endtag(self, tag):
+        # Pop back to the matching open tag, ignoring stray closing tags
+        for depth in range(len(self.stack) - 1, 0, -1):
+            if self.stack[depth].tag_name == tag:
+                del self.stack[depth:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+class PageSnapshot(SnapshotElement):
+    # A parsed page that can stand in for the driver, so extractors also run on saved HTML fixtures
+    def __init__(self, page_source, url=None):
+        builder = _SnapshotBuilder()
+        builder.feed(page_source)
+        builder.close()
+        super().__init__("#document", [])
+        self.children = builder.document.children
+        for child in self.children:
+            if isinstance(child, SnapshotElement):
+                child.parent = self
+        self.page_source = page_source
+        self.current_url = url
+
+    @classmethod
+    def from_file(cls, path, url=None):
+        with open(path, encoding="utf-8") as html_file:
+            return cls(html_file.read(), url)
+
+    def get(self, url):
+        self.current_url = url
@@ -0,0 +1,113 @@
+# Scoring Distribution Analytics:
+# Work out how scoring is spread across a roster from getPlayerStats tables, for one team or the
+# whole league at once: each player's share of team points, a scoring tier, a usage-style share
+# of possessions, per-36-minute rates and a Gini concentration index per team.
+
+from array import array
+
+from statTable import StatTable
+
+# Minimum share of team points for each tier, checked from the top
+TIERS = ((0.18, "Primary Scorer"), (0.10, "Secondary Scorer"), (0.05, "Role Player"), (0.0, "Bench"))
+
+# Columns of the per-player results table
+COLUMNS = ("TEAM", "PLAYER", "GP", "MIN", "PTS", "PTS SHARE", "USG SHARE", "PTS/36", "TIER")
+
+
+def gini(values):
+    # 0 when every player scores the same, approaching 1 when one player scores everything
+    values = sorted(values)
+    total = sum(values)
+    if not values or total <= 0:
+        return 0.0
+    n = len(values)
+    return 2 * sum(i * value for i, value in enumerate(values, 1)) / (n * total) - (n + 1) / n
+
+
+def tier(share):
+    for minimum, name in TIERS:
+        if share >= minimum:
+            return name
+    return TIERS[-1][1]
+
+
+def stat_column(table, name, default=0.0):
+    # A numeric column by name, or a column of defaults when the page did not have it
+    if name in table.header and table.numeric[table.header.index(name)]:
+        return table.column(name)
+    return array("d", [default] * len(table))
+
+
+class ScoringDistribution:
+    def __init__(self, team_tables):
+        # team_tables maps a team name to its getPlayerStats [header] + rows table or StatTable;
+        # every team's columns are concatenated so each metric is one pass over the league
+        self.teams = array("i")
+        self.team_names = []
+        self.players = []
+        self.games = array("d")
+        self.minutes = array("d")
+        self.points = array("d")
+        self.possessions = array("d")
+        for team_num, (team, table) in enumerate(team_tables.items()):
+            table = table if isinstance(table, StatTable) else StatTable(table)
+            self.team_names.append(team)
+            self.teams.extend([team_num] * len(table))
+            self.players.extend(table.columns[0])
+            self.games.extend(stat_column(table, "GP", 1.0))
+            self.minutes.extend(stat_column(table, "MIN"))
+            self.points.extend(stat_column(table, "PTS"))
+
+            # Possessions used per game: shots, trips to the line and turnovers
+            fga, fta, tov = stat_column(table, "FGA"), stat_column(table, "FTA"), stat_column(table, "TOV")
+            self.possessions.extend(array("d", map(lambda a, f, t: a + 0.44 * f + t, fga, fta, tov)))
+        self.compute()
+
+    def compute(self):
+        # Season totals, then team sums, then every per-player ratio in one pass each
+        season_points = array("d", map(lambda pts, gp: pts * gp, self.points, self.games))
+        season_possessions = array("d", map(lambda pos, gp: pos * gp, self.possessions, self.games))
+        team_points = array("d", [0.0] * len(self.team_names))
+        team_possessions = array("d", [0.0] * len(self.team_names))
+        for team_num, pts, pos in zip(self.teams, season_points, season_possessions):
+            team_points[team_num] += pts
+            team_possessions[team_num] += pos
+
+        self.share = array("d", (pts / team_points[team_num] if team_points[team_num] else 0.0
+                                 for team_num, pts in zip(self.teams, season_points)))
+        self.usage = array("d", (pos / team_possessions[team_num] if team_possessions[team_num] else 0.0
+                                 for team_num, pos in zip(self.teams, season_possessions)))
+        self.per_36 = array("d", (pts / mins * 36 if mins else 0.0 for pts, mins in zip(self.points, self.minutes)))
+        self.tiers = [tier(share) for share in self.share]
+
+        # Gini index and the top three scorers' share for each team
+        team_values = [[] for _ in self.team_names]
+        for team_num, pts in zip(self.teams, season_points):
+            team_values[team_num].append(pts)
+        self.gini = {team: gini(values) for team, values in zip(self.team_names, team_values)}
+        self.top_3_share = {team: sum(sorted(values, reverse=True)[:3]) / total if (total := sum(values)) else 0.0
+                            for team, values in zip(self.team_names, team_values)}
+
+    def rows(self, team=None):
+        # The per-player results as display rows, top scorers first, for one team or the league
+        team_num = self.team_names.index(team) if team is not None else None
+        order = [i for i in range(len(self.players)) if team_num is None or self.teams[i] == team_num]
+        order.sort(key=lambda i: self.share[i], reverse=True)
+        return [[self.team_names[self.teams[i]], self.players[i], f"{self.games[i]:g}", f"{self.minutes[i]:.1f}", f"{self.points[i]:.1f}",
+                 f"{self.share[i]:.1%}", f"{self.usage[i]:.1%}", f"{self.per_36[i]:.1f}", self.tiers[i]] for i in order]
+
+    def summary(self, team):
+        team_num = self.team_names.index(team)
+        tiers = {name: 0 for _, name in TIERS}
+        for i in range(len(self.players)):
+            if self.teams[i] == team_num:
+                tiers[self.tiers[i]] += 1
+        return {"gini": self.gini[team], "top_3_share": self.top_3_share[team], "tiers": tiers}
+
+
+def team_distribution(team, player_stats):
+    return ScoringDistribution({team: player_stats})
+
+
+def league_distribution(team_tables):
+    return ScoringDistribution(team_tables)
@@ -0,0 +1,39 @@
+# Service Client:
+# Fetch team data from a running hoopService instead of scraping, so a kiosk can run as a thin
+# client that never starts a browser of its own.
+
+import http.client
+import json
+from urllib.parse import quote, urlsplit
+
+
+class ServiceClient:
+    # Thin client side: fetch team data from a running service instead of scraping
+    def __init__(self, base_url, timeout=120):
+        parts = urlsplit(base_url)
+        self.host = parts.netloc
+        self.base_path = parts.path.rstrip("/")
+        self.timeout = timeout
+
+    def get(self, path):
+        connection = http.client.HTTPConnection(self.host, timeout=self.timeout)
+        try:
+            connection.request("GET", f"{self.base_path}{path}")
+            response = connection.getresponse()
+            body = json.loads(response.read())
+        finally:
+            connection.close()
+        if response.status != 200:
+            raise RuntimeError(body.get("error", f"HTTP {response.status}"))
+        return body
+
+    def team(self, team, kinds):
+        return self.get(f"/team/{quote(team.lower())}?kinds={','.join(kinds)}")["data"]
+
+    def seasons(self, team):
+        # Seasons the service has recorded stats for, newest first
+        return self.get(f"/history/{quote(team.lower())}")["seasons"]
+
+    def history(self, team, season, kinds):
+        # {kind: latest [header] + rows snapshot or None} for one recorded season
+        return self.get(f"/history/{quote(team.lower())}?season={quote(season)}&kinds={','.join(kinds)}")["data"]
@@ -0,0 +1,88 @@
+# Stat Tables:
+# Parse a scraped [header] + rows stats table once into typed columns: numeric columns become
+# compact float arrays, text columns stay as lists, and players are indexed by name.
+
+import re
+import unicodedata
+from array import array
+
+MISSING_VALUES = {"", "-", "--", "N/A"}
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+
+
+def normalize_name(name):
+    # "Luka Dončić" / "luka doncic" and "Jaren Jackson Jr." / "Jaren Jackson" map to the same key
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(char for char in name if not unicodedata.combining(char)).lower()
+    words = re.sub(r"[^a-z0-9 ]+", " ", name.replace("'", "").replace(".", "")).split()
+    while len(words) > 1 and words[-1] in NAME_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def parse_number(value):
+    value = value.strip().replace(",", "").rstrip("%")
+    if value in MISSING_VALUES:
+        return 0.0
+    return float(value)
+
+
+def parse_column(values):
+    # Returns a float array when every cell is numeric, otherwise None
+    try:
+        return array("d", (parse_number(value) for value in values))
+    except ValueError:
+        return None
+
+
+class StatTable:
+    def __init__(self, table):
+        self.header = list(table[0])
+        self.rows = [list(row) + [""] * (len(self.header) - len(row)) for row in table[1:]]
+
+        # Column-major storage, parsed once
+        self.columns = []
+        self.numeric = []
+        for i in range(len(self.header)):
+            values = [row[i] for row in self.rows]
+            parsed = parse_column(values) if i > 0 else None
+            self.columns.append(parsed if parsed is not None else values)
+            self.numeric.append(parsed is not None)
+
+        # Normalized player name (first column) -> row number
+        self.index = {}
+        for row_num, row in enumerate(self.rows):
+            self.index.setdefault(normalize_name(row[0]), row_num)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def as_lists(self):
+        # The [header] + rows view the Treeviews are filled from
+        return [self.header] + self.rows
+
+    def column(self, name):
+        return self.columns[self.header.index(name)]
+
+    def find(self, player):
+        return self.index.get(normalize_name(player))
+
+    def find_many(self, players):
+        # Row numbers for many players at once, None for players without stats
+        return {player: self.find(player) for player in players}
+
+    def rows_for(self, players):
+        return {player: self.row(player) for player in players}
+
+    def row(self, player):
+        # The displayed strings for a player, or a row of zeros if they have no stats
+        row_num = self.find(player)
+        if row_num is None:
+            return [player] + ["0"] * (len(self.header) - 1)
+        return self.rows[row_num]
+
+    def numbers(self, player):
+        # Parsed values for a player; text columns are None, missing players are all zeros
+        row_num = self.find(player)
+        return [None if not numeric else 0.0 if row_num is None else column[row_num]
+                for column, numeric in zip(self.columns, self.numeric)]
@@ -0,0 +1,149 @@
+# Stats Client:
+# Read the traditional team and player stats straight from the stats JSON endpoints that back the
+# nba.com stats pages, over pooled keep-alive connections with gzip and conditional requests, and
+# return them in the same [header] + rows shape the page scrapers produce.
+
+import gzip
+import http.client
+import json
+import queue
+import threading
+from urllib.parse import urlencode, urlsplit
+
+STATS_URL = "https://stats.nba.com/stats"
+
+# The stats pages send these headers; the endpoints stall requests without them
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Encoding": "gzip",
+    "Connection": "keep-alive",
+    "Origin": "https://www.nba.com",
+    "Referer": "https://www.nba.com/",
+}
+
+# (page column, JSON field, kind of value) in the order the stats pages show them
+STAT_COLUMNS = [("GP", "GP", "int"), ("MIN", "MIN", "float"), ("PTS", "PTS", "float"), ("FGM", "FGM", "float"), ("FGA", "FGA", "float"),
+                ("FG%", "FG_PCT", "pct"), ("3PM", "FG3M", "float"), ("3PA", "FG3A", "float"), ("3P%", "FG3_PCT", "pct"),
+                ("FTM", "FTM", "float"), ("FTA", "FTA", "float"), ("FT%", "FT_PCT", "pct"), ("OREB", "OREB", "float"),
+                ("DREB", "DREB", "float"), ("REB", "REB", "float"), ("AST", "AST", "float"), ("TOV", "TOV", "float"),
+                ("STL", "STL", "float"), ("BLK", "BLK", "float"), ("PF", "PF", "float"), ("+/-", "PLUS_MINUS", "float")]
+
+# The splits getOverallStats reads from the first three tables of the team traditional page
+OVERALL_RESULT_SETS = ("OverallTeamDashboard", "LocationTeamDashboard", "WinsLossesTeamDashboard")
+
+
+def format_value(value, kind):
+    if value is None:
+        return "-"
+    if kind == "int":
+        return str(int(value))
+    if kind == "pct":
+        return f"{value * 100:.1f}"
+    return f"{value:.1f}"
+
+
+def result_set(payload, name):
+    for result in payload.get("resultSets", []):
+        if result.get("name") == name:
+            return result["headers"], result["rowSet"]
+    raise KeyError(f"No {name} result set in stats response")
+
+
+def table_rows(headers, rows, name_field):
+    positions = {field: i for i, field in enumerate(headers)}
+    return [[str(row[positions[name_field]])] + [format_value(row[positions[field]] if field in positions else None, kind)
+                                                for _, field, kind in STAT_COLUMNS] for row in rows]
+
+
+class StatsClient:
+    def __init__(self, base_url=STATS_URL, timeout=10, pool_size=4):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme
+        self.host = parts.netloc
+        self.base_path = parts.path.rstrip("/")
+        self.base_url = base_url
+        self.timeout = timeout
+
+        # Idle keep-alive connections and, per URL, the validators and body of the last 200 response
+        self.connections = queue.LifoQueue(maxsize=pool_size)
+        self.responses = {}
+        self.lock = threading.Lock()
+
+    def connection(self):
+        try:
+            return self.connections.get_nowait()
+        except queue.Empty:
+            connection_class = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            return connection_class(self.host, timeout=self.timeout)
+
+    def release(self, connection):
+        try:
+            self.connections.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def get_json(self, endpoint, params):
+        path = f"{self.base_path}/{endpoint}?{urlencode(params)}"
+        headers = dict(REQUEST_HEADERS)
+        with self.lock:
+            cached = self.responses.get(path)
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        # A pooled connection may have been closed by the server while idle, so retry once on a new one
+        for attempt in range(2):
+            connection = self.connection()
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest, ConnectionError):
+                connection.close()
+                if attempt:
+                    raise
+                continue
+            if response.will_close:
+                connection.close()
+            else:
+                self.release(connection)
+            break
+
+        if response.status == 304 and cached:
+            return cached["payload"]
+        if response.status != 200:
+            raise RuntimeError(f"Stats request {endpoint} failed with HTTP {response.status}")
+        if response.getheader("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        payload = json.loads(body)
+        with self.lock:
+            self.responses[path] = {"etag": response.getheader("ETag"), "last_modified": response.getheader("Last-Modified"), "payload": payload}
+        return payload
+
+    def season_params(self, team_id, season):
+        return {"TeamID": team_id, "Season": season, "SeasonType": "Regular Season", "MeasureType": "Base", "PerMode": "PerGame",
+                "PlusMinus": "N", "PaceAdjust": "N", "Rank": "N", "LeagueID": "00", "LastNGames": 0, "Month": 0,
+                "OpponentTeamID": 0, "Period": 0, "DateFrom": "", "DateTo": "", "GameSegment": "", "Location": "",
+                "Outcome": "", "SeasonSegment": "", "VsConference": "", "VsDivision": ""}
+
+    def getPlayerStats(self, team_id, season):
+        headers, rows = result_set(self.get_json("teamplayerdashboard", self.season_params(team_id, season)), "PlayersSeasonTotals")
+        return [["Player"] + [column for column, _, _ in STAT_COLUMNS]] + table_rows(headers, rows, "PLAYER_NAME")
+
+    def getOverallStats(self, team_id, season):
+        payload = self.get_json("teamdashboardbygeneralsplits", self.season_params(team_id, season))
+        all_data = []
+        for name in OVERALL_RESULT_SETS:
+            headers, rows = result_set(payload, name)
+            all_data.extend(table_rows(headers, rows, "GROUP_VALUE"))
+        return [[""] + [column for column, _, _ in STAT_COLUMNS]] + all_data
+
+    def close(self):
+        while True:
+            try:
+                self.connections.get_nowait().close()
+            except queue.Empty:
+                break
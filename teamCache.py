@@ -0,0 +1,63 @@
+# Team Cache:
+# Keep scraped team data on disk, keyed by team id and data kind, so a team can be shown
+# straight away and only the kinds whose time-to-live has expired need to be scraped again.
+
+import json
+import os
+import threading
+import time
+
+# Seconds each kind of data stays fresh
+DEFAULT_TTLS = {
+    "roster": 60 * 60,
+    "player_stats": 10 * 60,
+    "overall_stats": 10 * 60,
+    "game_log": 30 * 60,
+    "franchise": 3 * 24 * 60 * 60,
+}
+
+
+class TeamCache:
+    def __init__(self, directory="team_cache", ttls=None):
+        self.directory = directory
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, team_id, kind):
+        return os.path.join(self.directory, f"{team_id}_{kind}.json")
+
+    def get(self, team_id, kind):
+        # Returns (data, fresh); data is None when nothing has been cached yet
+        try:
+            with open(self.path(team_id, kind), encoding="utf-8") as cache_file:
+                entry = json.load(cache_file)
+        except (OSError, ValueError):
+            return None, False
+        age = time.time() - entry.get("scraped_at", 0)
+        return entry.get("data"), age < self.ttls.get(kind, 0)
+
+    def put(self, team_id, kind, data):
+        entry = {"team_id": team_id, "kind": kind, "scraped_at": time.time(), "data": data}
+        path = self.path(team_id, kind)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+
+        # Write to a temporary file first so readers never see a half-written entry
+        with self.lock:
+            with open(temp_path, "w", encoding="utf-8") as cache_file:
+                json.dump(entry, cache_file)
+            os.replace(temp_path, path)
+
+    def load_team(self, team_id):
+        # Returns every cached kind for the team and the kinds that are missing or stale
+        team_data = {}
+        stale = []
+        for kind in self.ttls:
+            data, fresh = self.get(team_id, kind)
+            if data is not None:
+                team_data[kind] = data
+            if not fresh:
+                stale.append(kind)
+        return team_data, stale
@@ -0,0 +1,93 @@
+# Game Log tests:
+# Read a saved box score page with the scraper's extractor and stream it into a GameLogStore.
+#
+#   python -m pytest test_gameLog.py
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from gameLog import GameLogStore, iter_games
+from nbaScraper import NBAScraper
+from pageSnapshot import PageSnapshot
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_fixtures")
+BOXSCORES_URL = "https://www.nba.com/stats/team/1610612738/boxscores-traditional"
+TEAM_ID = 1610612738
+SEASON = "2023-24"
+
+
+def read_fixture(scraper, extractor, name, url):
+    # Hand the extractor the saved page as the driver's parsed snapshot, as "source" mode does
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as fixture_file:
+        html = fixture_file.read()
+    driver = object()
+    scraper.page_snapshots[driver] = {url: PageSnapshot(html, url)}
+    return extractor(driver, url)
+
+
+class GameLogTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "history.db")
+        scraper = NBAScraper(cache_directory=os.path.join(self.directory.name, "cache"), history_path=self.path)
+        self.table = read_fixture(scraper, scraper.getGameLog, "boxscores.html", BOXSCORES_URL)
+        self.store = GameLogStore(self.path)
+
+    def tearDown(self):
+        self.store.connection.close()
+        self.directory.cleanup()
+
+    def stored_games(self):
+        with sqlite3.connect(self.path) as connection:
+            return connection.execute("SELECT COUNT(*) FROM game_logs").fetchone()[0]
+
+    def test_iter_games_reads_the_fixture_newest_first(self):
+        games = list(iter_games(self.table))
+        self.assertEqual(len(games), 12)
+        self.assertEqual(games[0][:2], ("2023-11-17", "BOS vs. TOR"))
+        self.assertEqual(games[-1][:2], ("2023-10-25", "BOS @ NYK"))
+        self.assertEqual(games[0][2][5], "108")
+
+    def test_iter_games_accepts_header_variants_and_skips_unknown_tables(self):
+        header = ["TEAM", "MATCHUP", "GAME_DATE", "PTS"]
+        self.assertEqual(list(iter_games([header, ["BOS", "BOS @ NYK", "10/25/2023", "108"]])),
+                         [("2023-10-25", "BOS @ NYK", ["BOS", "BOS @ NYK", "10/25/2023", "108"])])
+        self.assertEqual(list(iter_games([["Player", "PTS"], ["Jayson Tatum", "26.9"]])), [])
+
+    def test_ingest_stops_at_the_first_stored_game(self):
+        header, rows = self.table[0], self.table[1:]
+        self.store.ingest(TEAM_ID, SEASON, [header] + rows[3:])
+        self.assertEqual(self.stored_games(), 9)
+
+        # Games before the first stored one are never read again, even if the page now shows them differently
+        changed = [list(row) for row in rows]
+        changed[-1][5] = "0"
+        game_log = self.store.ingest(TEAM_ID, SEASON, [header] + changed)
+        self.assertEqual(self.stored_games(), 12)
+        self.assertEqual(len(game_log.games), 12)
+        self.assertEqual(game_log.games[0][5], "108")
+        self.assertEqual(game_log.rows()[0][:2], ["11/17/2023", "BOS vs. TOR"])
+
+    def test_rolling_averages(self):
+        game_log = self.store.ingest(TEAM_ID, SEASON, self.table)
+        averages = game_log.last()
+        self.assertAlmostEqual(averages["PTS"][5], 110.4)
+        self.assertAlmostEqual(averages["PTS"][10], 117.5)
+        self.assertAlmostEqual(averages["REB"][5], 46.8)
+        self.assertAlmostEqual(averages["REB"][10], 47.0)
+        self.assertAlmostEqual(averages["AST"][5], 24.0)
+        self.assertEqual(game_log.rows()[0][-2:], ["110.4", "117.5"])
+
+    def test_a_new_session_rebuilds_the_same_averages_from_the_store(self):
+        expected = self.store.ingest(TEAM_ID, SEASON, self.table).last()
+        reopened = GameLogStore(self.path)
+        try:
+            self.assertEqual(reopened.log(TEAM_ID, SEASON).last(), expected)
+        finally:
+            reopened.connection.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# Page Snapshot tests:
+# Run the scraper's extractors on saved nba.com pages through PageSnapshot and check the exact
+# [header] + rows tables they return, the shapes the Tk tabs and the history store are built from.
+#
+#   python -m pytest test_pageSnapshot.py
+
+import os
+import tempfile
+import unittest
+
+from nbaScraper import NBAScraper
+from pageSnapshot import By, NoSuchElementException, PageSnapshot
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_fixtures")
+TEAM_URL = "https://www.nba.com/team/1610612738/celtics"
+PLAYERS_URL = "https://www.nba.com/stats/team/1610612738/players-traditional"
+TRADITIONAL_URL = "https://www.nba.com/stats/team/1610612738/traditional"
+
+
+class ExtractorFixtureTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.scraper = NBAScraper(cache_directory=os.path.join(cls.directory.name, "cache"),
+                                 history_path=os.path.join(cls.directory.name, "history.db"))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def extract(self, extractor, name, url):
+        # Hand the extractor the saved page as the driver's parsed snapshot, as "source" mode does
+        driver = object()
+        self.scraper.page_snapshots[driver] = {url: PageSnapshot.from_file(os.path.join(FIXTURES, name), url)}
+        try:
+            return extractor(driver, url)
+        finally:
+            self.scraper.page_snapshots.pop(driver)
+
+    def test_roster(self):
+        self.assertEqual(self.extract(self.scraper.getRoster, "team.html", TEAM_URL), [
+            ["Player", "#", "Pos", "Height", "Weight", "Birthdate", "Age", "Exp", "School", "How Acquired"],
+            ["Jayson Tatum", "0", "F-G", "6-8", "210 lbs", "MAR 3, 1998", "26", "6", "Duke", "#3 Pick in 2017 Draft"],
+            ["Jaylen Brown", "7", "G-F", "6-6", "223 lbs", "OCT 24, 1996", "27", "7", "California", "#3 Pick in 2016 Draft"],
+            ["Derrick White", "9", "G", "6-4", "190 lbs", "JUL 2, 1994", "29", "6", "Colorado", "Traded from SAS (2022)"],
+            ["Sam Hauser", "30", "F", "6-7", "217 lbs", "DEC 8, 1997", "26", "2", "Virginia", "Signed as Free Agent (2021)"],
+        ])
+
+    def test_coaching_staff(self):
+        self.assertEqual(self.extract(self.scraper.getCoachingStaff, "team.html", TEAM_URL), [
+            ["Head Coach", "Assistant Coaches", "Trainers"],
+            ["Joe Mazzulla"],
+            ["Charles Lee", "Sam Cassell", "Tony Dobbins"],
+            ["Art Horne", "Brandon Rosen"],
+        ])
+
+    def test_team_updates(self):
+        self.assertEqual(self.extract(self.scraper.getTeamUpdates, "team.html", TEAM_URL), [
+            {"date": "May 10, 2024", "headline": "Tatum & Brown combine for 55",
+             "content": "Jayson Tatum scored 28 points and Jaylen Brown added 27 in Game 2.\nBoston leads the series 2-0."},
+            {"date": "May 8, 2024", "headline": "Porzingis out for Game 2",
+             "content": "Kristaps Porzingis (calf) will not play\non Thursday."},
+        ])
+
+    def test_player_stats(self):
+        self.assertEqual(self.extract(self.scraper.getPlayerStats, "players_traditional.html", PLAYERS_URL), [
+            ["Player", "GP", "MIN", "PTS", "FG%", "3P%", "REB", "AST", "+/-"],
+            ["Jayson Tatum", "74", "35.7", "26.9", "47.1", "37.6", "8.1", "4.9", "7.3"],
+            ["Jaylen Brown", "70", "33.5", "23.0", "49.9", "35.4", "5.5", "3.6", "5.4"],
+            ["Kristaps Porziņģis", "57", "29.6", "20.1", "51.6", "37.5", "7.2", "2.0", "7.1"],
+            ["Jrue Holiday", "69", "32.8", "12.5", "48.0", "42.9", "5.4", "4.8", "-"],
+        ])
+
+    def test_overall_stats_read_the_first_three_tables(self):
+        self.assertEqual(self.extract(self.scraper.getOverallStats, "traditional.html", TRADITIONAL_URL), [
+            ["", "GP", "W", "L", "PTS", "REB", "+/-"],
+            ["2023-24", "82", "64", "18", "120.6", "46.3", "11.3"],
+            ["Home", "41", "37", "4", "122.1", "47.0", "14.3"],
+            ["Road", "41", "27", "14", "119.0", "45.6", "8.2"],
+            ["Wins", "64", "64", "0", "123.4", "47.2", "16.6"],
+            ["Losses", "18", "0", "18", "110.7", "43.2", "-7.4"],
+        ])
+
+    def test_retired_numbers(self):
+        self.assertEqual(self.extract(self.scraper.getRetiredNumbers, "team.html", TEAM_URL), [
+            ["No.", "Player", "Position", "Seasons With Team", "Year"],
+            ["1", "Walter Brown", "Founder", "1945-64", "1964"],
+            ["2", "Red Auerbach", "Coach", "1950-66", "1985"],
+            ["6", "Bill Russell", "C", "1956-69", "1972"],
+        ])
+
+    def test_hall_of_fame(self):
+        self.assertEqual(self.extract(self.scraper.getHallOfFame, "team.html", TEAM_URL), [
+            ["Player", "Position", "Seasons With Team", "Year"],
+            ["Ray Allen", "G", "2007-12", "2018"],
+            ["Kevin Garnett", "F", "2007-13", "2020"],
+        ])
+
+    def test_all_time(self):
+        self.assertEqual(self.extract(self.scraper.getAllTime, "team.html", TEAM_URL), [
+            ["Points", "John Havlicek", "26,395"],
+            ["Rebounds", "Bill Russell", "21,620"],
+            ["Assists", "Bob Cousy", "6,945"],
+        ])
+
+    def test_achievements(self):
+        self.assertEqual(self.extract(self.scraper.getAchievements, "team.html", TEAM_URL), [
+            ["NBA Championships", "Conference Titles", "Division Titles"],
+            ["2024", "2008", "1986"],
+            ["2024", "2022", "2010"],
+            ["2024", "2023"],
+        ])
+
+    def test_franchise_groups_every_section(self):
+        franchise = self.extract(self.scraper.getFranchise, "team.html", TEAM_URL)
+        self.assertEqual(sorted(franchise), ["achievements", "all_time", "hall_of_fame", "retired_numbers"])
+        self.assertEqual(franchise["all_time"][0], ["Points", "John Havlicek", "26,395"])
+
+
+class SnapshotTextTest(unittest.TestCase):
+    def test_text_follows_blocks_cells_and_hidden_tags(self):
+        page = PageSnapshot("<div id='a'>First <b>bold</b><script>x()</script><p>Second</p>Third<br>Fourth"
+                            "<table><tr><td>A</td><td> B </td></tr></table></div>")
+        self.assertEqual(page.find_element(By.TAG_NAME, "div").text, "First bold\nSecond\nThird\nFourth\nA B")
+
+    def test_missing_element_raises(self):
+        with self.assertRaises(NoSuchElementException):
+            PageSnapshot("<p>nothing here</p>").find_element(By.CLASS_NAME, "TeamRecords_table__0iapO")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# Stats Client tests:
+# Run StatsClient against a local http.server stand-in for the stats endpoints.
+#
+#   python -m pytest test_statsClient.py
+
+import gzip
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from statsClient import STAT_COLUMNS, StatsClient
+
+PLAYER_HEADERS = ["PLAYER_ID", "PLAYER_NAME"] + [field for _, field, _ in STAT_COLUMNS]
+PLAYER_ROW = [1, "Jayson Tatum", 74, 35.7, 26.9, 9.1, 19.3, 0.471, 3.1, 8.2, 0.376, 5.6, 6.7, 0.833, 0.9, 7.2, 8.1, 4.9, 2.5, 1.0, 0.6, 1.9, 7.3]
+SPLIT_HEADERS = ["GROUP_SET", "GROUP_VALUE"] + [field for _, field, _ in STAT_COLUMNS]
+
+
+def split_row(name):
+    return ["Split", name, 82, 48.2, 120.6, 43.9, 89.3, 0.492, 16.5, 42.5, 0.388, 16.3, 20.6, 0.791, 10.9, 35.6, 46.5, 26.8, 12.1, 6.8, 6.6, 15.9, None]
+
+
+PAYLOADS = {
+    "teamplayerdashboard": {"resultSets": [{"name": "PlayersSeasonTotals", "headers": PLAYER_HEADERS, "rowSet": [PLAYER_ROW]}]},
+    "teamdashboardbygeneralsplits": {"resultSets": [
+        {"name": "OverallTeamDashboard", "headers": SPLIT_HEADERS, "rowSet": [split_row("2023-24")]},
+        {"name": "LocationTeamDashboard", "headers": SPLIT_HEADERS, "rowSet": [split_row("Home"), split_row("Road")]},
+        {"name": "WinsLossesTeamDashboard", "headers": SPLIT_HEADERS, "rowSet": [split_row("Wins"), split_row("Losses")]},
+    ]},
+}
+
+
+class StatsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(self.path)
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            body = gzip.compress(json.dumps(PAYLOADS[self.path.split("?")[0].rsplit("/", 1)[-1]]).encode("utf-8"))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        # Drop the connection after answering while still advertising keep-alive, like an idle timeout
+        if server.drop_after_response:
+            self.close_connection = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StatsClientTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StatsHandler)
+        self.server.requests = []
+        self.server.connections = 0
+        self.server.drop_after_response = False
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = StatsClient(f"http://127.0.0.1:{self.server.server_address[1]}/stats", timeout=5)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_player_stats_map_to_header_and_rows(self):
+        table = self.client.getPlayerStats(1610612738, "2023-24")
+        self.assertEqual(table[0], ["Player"] + [column for column, _, _ in STAT_COLUMNS])
+        self.assertEqual(len(table), 2)
+        row = dict(zip(table[0], table[1]))
+        self.assertEqual(row["Player"], "Jayson Tatum")
+        self.assertEqual(row["GP"], "74")
+        self.assertEqual(row["PTS"], "26.9")
+        self.assertEqual(row["FG%"], "47.1")
+        self.assertEqual(row["+/-"], "7.3")
+
+    def test_overall_stats_read_every_split(self):
+        table = self.client.getOverallStats(1610612738, "2023-24")
+        self.assertEqual(table[0][0], "")
+        self.assertEqual([row[0] for row in table[1:]], ["2023-24", "Home", "Road", "Wins", "Losses"])
+        self.assertEqual(table[1][-1], "-")
+
+    def test_gzip_body_is_decoded(self):
+        payload = self.client.get_json("teamplayerdashboard", {"TeamID": 1})
+        self.assertEqual(payload, PAYLOADS["teamplayerdashboard"])
+
+    def test_not_modified_reuses_the_cached_payload(self):
+        first = self.client.get_json("teamplayerdashboard", {"TeamID": 1})
+        second = self.client.get_json("teamplayerdashboard", {"TeamID": 1})
+        self.assertIs(second, first)
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_closed_pooled_connection_is_retried_on_a_new_one(self):
+        self.server.drop_after_response = True
+        self.client.get_json("teamplayerdashboard", {"TeamID": 1})
+        payload = self.client.get_json("teamplayerdashboard", {"TeamID": 2})
+        self.assertEqual(payload, PAYLOADS["teamplayerdashboard"])
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.server.connections, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+# View Manager:
+# Build each screen once as a full-window frame and switch between them by raising frames,
+# keeping the most recently used team views alive up to a configurable limit.
+
+import tkinter as tk
+from collections import OrderedDict
+
+
+class ViewManager:
+    def __init__(self, root, max_views=5, on_evict=None):
+        self.root = root
+        self.max_views = max_views
+        self.on_evict = on_evict
+        self.pinned = {}
+        self.views = OrderedDict()
+        self.current = None
+
+    def frame(self):
+        frame = tk.Frame(self.root)
+        frame.place(x=0, y=0, relwidth=1, relheight=1)
+        return frame
+
+    def pin(self, key, build):
+        # Views that are never evicted, like the home screen
+        frame = self.frame()
+        build(frame)
+        self.pinned[key] = frame
+        return frame
+
+    def get(self, key):
+        return self.pinned.get(key) or self.views.get(key)
+
+    def show(self, key, build=None):
+        # Raise a cached view, or build it first; returns (frame, built)
+        frame = self.get(key)
+        built = frame is None
+        if built:
+            frame = self.frame()
+            build(frame)
+            self.views[key] = frame
+        if key in self.views:
+            self.views.move_to_end(key)
+        frame.tkraise()
+        self.current = key
+        self.evict()
+        return frame, built
+
+    def evict(self):
+        # Destroy the least recently used views beyond the limit, never the one on screen
+        while len(self.views) > self.max_views:
+            key = next(iter(self.views))
+            if key == self.current:
+                self.views.move_to_end(key)
+                continue
+            frame = self.views.pop(key)
+            if self.on_evict:
+                self.on_evict(key)
+            frame.destroy()
@@ -0,0 +1,118 @@
+# Virtual Table:
+# A Treeview that only materializes the rows currently on screen (plus a small buffer) from an
+# underlying row store, and sorts by column by reordering the store instead of re-inserting items.
+
+import tkinter as tk
+from tkinter import ttk
+
+from statTable import parse_number
+
+
+class VirtualTable(tk.Frame):
+    def __init__(self, master, columns, height=20, buffer=2, **tree_options):
+        super().__init__(master)
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        tree_options.setdefault("show", "headings")
+        self.tree = ttk.Treeview(self, columns=columns, height=height, **tree_options)
+        self.tree.grid(row=0, column=0, sticky='nsew')
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.yview)
+        self.scrollbar.grid(row=0, column=1, sticky='ns')
+
+        # Row store and the window of it that is materialized as Treeview items
+        self.columns = list(columns)
+        self.rows = []
+        self.first = 0
+        self.visible = height
+        self.buffer = buffer
+        self.items = []
+        self.shown = []
+        self.sort_column = None
+        self.sort_reverse = False
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self.on_wheel)
+        self.tree.bind("<Configure>", self.on_resize)
+
+    def config(self, **options):
+        self.tree.config(**options)
+
+    def column(self, col, **options):
+        self.tree.column(col, **options)
+
+    def heading(self, col, **options):
+        # Clicking a heading sorts the store by that column
+        options.setdefault("command", lambda: self.sort_by(col))
+        self.tree.heading(col, **options)
+
+    def set_rows(self, rows):
+        self.rows = [list(row) for row in rows]
+        if self.sort_column is not None:
+            self.sort_rows()
+        self.render()
+
+    def sort_key(self, value):
+        # Numbers sort numerically and ahead of text
+        try:
+            return (0, parse_number(str(value)), "")
+        except ValueError:
+            return (1, 0.0, str(value))
+
+    def sort_rows(self):
+        i = self.columns.index(self.sort_column)
+        self.rows.sort(key=lambda row: self.sort_key(row[i] if i < len(row) else ""), reverse=self.sort_reverse)
+
+    def sort_by(self, col):
+        self.sort_reverse = not self.sort_reverse if self.sort_column == col else False
+        self.sort_column = col
+        self.sort_rows()
+        self.first = 0
+        self.render()
+
+    def render(self):
+        # Reuse the existing items and only touch the ones whose values changed
+        self.first = max(0, min(self.first, len(self.rows) - self.visible))
+        window = self.rows[self.first:self.first + self.visible + self.buffer]
+        for i, row in enumerate(window):
+            if i < len(self.items):
+                if self.shown[i] != row:
+                    self.tree.item(self.items[i], values=row)
+                    self.shown[i] = row
+            else:
+                self.items.append(self.tree.insert(parent='', index=tk.END, values=row))
+                self.shown.append(row)
+        if len(self.items) > len(window):
+            self.tree.delete(*self.items[len(window):])
+            del self.items[len(window):]
+            del self.shown[len(window):]
+        self.tree.yview_moveto(0)
+
+        if self.rows:
+            self.scrollbar.set(self.first / len(self.rows), min(1.0, (self.first + self.visible) / len(self.rows)))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self.first = int(float(args[1]) * len(self.rows))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self.visible if args[2] == "pages" else 1)
+            self.first += step
+        self.render()
+
+    def on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.first -= 3
+        else:
+            self.first += 3
+        self.render()
+        return "break"
+
+    def on_resize(self, event):
+        # Materialize as many rows as now fit on screen
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        visible = max(1, (event.height - row_height) // row_height)
+        if visible != self.visible:
+            self.visible = visible
+            self.render()